@@ -39,6 +39,7 @@ class SessionController:
     def _setup_client_callbacks(self) -> None:
         self._arduino_client.set_response_callback(self._handle_response)
         self._arduino_client.set_event_callback(self._handle_event)
+        self._arduino_client.set_status_callback(self._handle_status_change)
         self._arduino_client.set_heartbeat_callback(self._handle_heartbeat)
         self._arduino_client.set_ack_callback(self._handle_acknowledgment)
 
@@ -82,7 +83,7 @@ class SessionController:
         self._update_lighting_state(channel, intensity)
         sent = self._arduino_client.set_lighting_async(channel, intensity)
         if sent:
-            logger.debug(f"Sent {channel} lighting command to {intensity} (async)")
+            logger.debug("Sent {} lighting command to {} (async)", channel, intensity)
         else:
             logger.warning(f"Failed to send {channel} lighting command")
         return sent
@@ -111,7 +112,7 @@ class SessionController:
             return False
         sent = self._arduino_client.set_sections_async(clamped_sections)
         if sent:
-            logger.debug(f"Sent sections lighting command (async): {clamped_sections}")
+            logger.debug("Sent sections lighting command (async): {}", clamped_sections)
         else:
             logger.warning("Failed to send sections lighting command")
         return sent
@@ -274,25 +275,33 @@ class SessionController:
         return clamped_sections
 
     def _handle_response(self, response: Response) -> None:
-        logger.debug(f"Handling async response: {response}")
+        logger.debug("Handling async response: {}", response)
         self._response_callbacks.notify(response)
 
     def _handle_event(self, event: Message) -> None:
-        logger.info(f"Handling event: {event.type}")
+        logger.info("Handling event: {}", event.type)
         self._event_callbacks.notify(event)
 
     def _handle_heartbeat(self, health: ConnectionHealth) -> None:
         logger.debug(
-            f"Heartbeat received - alive: {health.is_alive}, uptime: {health.esp32_uptime_ms}ms"
+            "Heartbeat received - alive: {}, uptime: {}ms",
+            health.is_alive,
+            health.esp32_uptime_ms,
         )
         self._heartbeat_callbacks.notify(health)
 
     def _handle_acknowledgment(self, ack: AcknowledgmentInfo) -> None:
         logger.debug(
-            f"ACK received - type: {ack.received_type}, RTT: {ack.round_trip_ms:.1f}ms"
+            "ACK received - type: {}, RTT: {:.1f}ms",
+            ack.received_type,
+            ack.round_trip_ms,
         )
         self._ack_callbacks.notify(ack)
 
+    def _handle_status_change(self, status: ConnectionStatus) -> None:
+        logger.info("Connection status changed: {}", status)
+        self._update_connection_status(status)
+
     def _update_connection_status(self, status: ConnectionStatus) -> None:
         self._connection_status = status
         self._status_callbacks.notify(status)
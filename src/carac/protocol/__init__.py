@@ -1,15 +1,21 @@
 from .models import (
+    AcknowledgmentPayload,
     ConnectionStatus,
     ErrorCode,
+    HeartbeatPayload,
     Message,
     MessageType,
     Response,
+    decode_frame,
 )
 
 __all__ = [
+    "AcknowledgmentPayload",
     "ConnectionStatus",
     "ErrorCode",
+    "HeartbeatPayload",
     "Message",
     "MessageType",
     "Response",
+    "decode_frame",
 ]
\ No newline at end of file
@@ -1,8 +1,11 @@
 import json
+from abc import abstractmethod
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Literal
+from operator import itemgetter
+from typing import Any, ClassVar, Dict, Literal, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class MessageType(str, Enum):
@@ -51,36 +54,96 @@ class ConnectionStatus(str, Enum):
     ERROR = "error"
 
 
+_decode_json = json.JSONDecoder().decode
+
+
+def _raw_text(data: str | bytes) -> str:
+    if isinstance(data, bytes):
+        return data.decode("utf-8", errors="replace")
+    return data
+
+
+def _load_json(data: str | bytes) -> Any:
+    return _decode_json(_raw_text(data))
+
+
+def _append_sequence(frame: bytes, seq: int) -> bytes:
+    return b'%s, "seq": %d}\n' % (frame[:-2], seq)
+
+
 class Message(BaseModel):
     type: str
     payload: Dict[str, Any] = Field(default_factory=dict)
+    seq: int | None = None
 
     def to_serial(self) -> str:
-        data = {"type": self.type, "payload": self.payload}
+        data: Dict[str, Any] = {"type": self.type, "payload": self.payload}
+        if self.seq is not None:
+            data["seq"] = self.seq
         return json.dumps(data) + "\n"
 
+    def to_bytes(self, seq: int | None = None) -> bytes:
+        data: Dict[str, Any] = {"type": self.type, "payload": self.payload}
+        if seq is None:
+            seq = self.seq
+        if seq is not None:
+            data["seq"] = seq
+        return b"%s\n" % json.dumps(data).encode("utf-8")
+
     @classmethod
-    def from_serial(cls, data: str) -> "Message":
+    def from_serial(cls, data: str | bytes) -> "Message":
+        if not data or not data.strip():
+            return cls._parse_error("Empty message received", data)
         try:
-            if not data or not data.strip():
-                return cls(
-                    type=MessageType.RESPONSE_ERROR,
-                    payload={
-                        "message": "Empty message received",
-                        "error_code": ErrorCode.PARSE_ERROR,
-                        "data": {"raw": data},
-                    },
-                )
-            return cls(**json.loads(data.strip()))
+            decoded = _load_json(data)
         except (json.JSONDecodeError, ValueError) as e:
-            return cls(
-                type=MessageType.RESPONSE_ERROR,
-                payload={
-                    "message": f"Failed to parse message: {e}",
-                    "error_code": ErrorCode.PARSE_ERROR,
-                    "data": {"raw": data},
-                },
-            )
+            return cls._parse_error(f"Failed to parse message: {e}", data)
+        return cls.from_decoded(decoded, data)
+
+    @classmethod
+    def from_decoded(cls, decoded: Any, raw: str | bytes) -> "Message":
+        try:
+            return cls(**decoded)
+        except ValueError as e:
+            return cls._parse_error(f"Failed to parse message: {e}", raw)
+
+    @classmethod
+    def _parse_error(cls, message: str, raw: str | bytes) -> "Message":
+        return cls(
+            type=MessageType.RESPONSE_ERROR,
+            payload={
+                "message": message,
+                "error_code": ErrorCode.PARSE_ERROR,
+                "data": {"raw": _raw_text(raw)},
+            },
+        )
+
+
+class StaticCommand(Message):
+    model_config = ConfigDict(frozen=True)
+
+    _CACHED_BYTES: ClassVar[bytes | None] = None
+    _SHARED: ClassVar["StaticCommand | None"] = None
+
+    @classmethod
+    @abstractmethod
+    def create(cls) -> Self: ...
+
+    @classmethod
+    def shared(cls) -> Self:
+        shared: Self | None = cls.__dict__.get("_SHARED")
+        if shared is None:
+            shared = cls._SHARED = cls.create()
+        return shared
+
+    def to_bytes(self, seq: int | None = None) -> bytes:
+        if self.payload or self.seq is not None:
+            return super().to_bytes(seq)
+        cls = type(self)
+        frame: bytes | None = cls.__dict__.get("_CACHED_BYTES")
+        if frame is None:
+            frame = cls._CACHED_BYTES = super().to_bytes()
+        return frame if seq is None else _append_sequence(frame, seq)
 
 
 class LightingSetCommand(Message):
@@ -117,7 +180,7 @@ class MotorPositionCommand(Message):
         return cls(type=MessageType.MOTOR_POSITION, payload=payload)
 
 
-class MotorFlipCommand(Message):
+class MotorFlipCommand(StaticCommand):
     @classmethod
     def create(cls) -> "MotorFlipCommand":
         return cls(type=MessageType.MOTOR_FLIP, payload={})
@@ -132,31 +195,31 @@ class CameraTriggerCommand(Message):
         )
 
 
-class SystemPingCommand(Message):
+class SystemPingCommand(StaticCommand):
     @classmethod
     def create(cls) -> "SystemPingCommand":
         return cls(type=MessageType.SYSTEM_PING, payload={})
 
 
-class SystemStatusCommand(Message):
+class SystemStatusCommand(StaticCommand):
     @classmethod
     def create(cls) -> "SystemStatusCommand":
         return cls(type=MessageType.SYSTEM_STATUS, payload={})
 
 
-class SystemResetCommand(Message):
+class SystemResetCommand(StaticCommand):
     @classmethod
     def create(cls) -> "SystemResetCommand":
         return cls(type=MessageType.SYSTEM_RESET, payload={})
 
 
-class SystemEmergencyStopCommand(Message):
+class SystemEmergencyStopCommand(StaticCommand):
     @classmethod
     def create(cls) -> "SystemEmergencyStopCommand":
         return cls(type=MessageType.SYSTEM_EMERGENCY_STOP, payload={})
 
 
-class TestLedToggleCommand(Message):
+class TestLedToggleCommand(StaticCommand):
     @classmethod
     def create(cls) -> "TestLedToggleCommand":
         return cls(type=MessageType.TEST_LED_TOGGLE, payload={})
@@ -168,6 +231,68 @@ class SetBacklightCommand(Message):
         return cls(type=MessageType.SET_BACKLIGHT, payload={"enabled": enabled})
 
 
+_HEARTBEAT_FIELDS = itemgetter("uptime", "status")
+_ACKNOWLEDGMENT_FIELDS = itemgetter("received_type", "timestamp")
+
+
+@dataclass(slots=True, frozen=True)
+class HeartbeatPayload:
+    uptime: int = 0
+    status: str = "unknown"
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "HeartbeatPayload":
+        try:
+            return cls(*_HEARTBEAT_FIELDS(payload))
+        except KeyError:
+            pass
+        return cls(
+            uptime=payload.get("uptime", 0),
+            status=payload.get("status", "unknown"),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class AcknowledgmentPayload:
+    received_type: str = "unknown"
+    timestamp: int = 0
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "AcknowledgmentPayload":
+        try:
+            return cls(*_ACKNOWLEDGMENT_FIELDS(payload))
+        except KeyError:
+            pass
+        return cls(
+            received_type=payload.get("received_type", "unknown"),
+            timestamp=payload.get("timestamp", 0),
+        )
+
+
+_PAYLOAD_DECODERS: dict[
+    str, type[HeartbeatPayload] | type[AcknowledgmentPayload]
+] = {
+    MessageType.EVENT_HEARTBEAT: HeartbeatPayload,
+    MessageType.RESPONSE_ACK: AcknowledgmentPayload,
+}
+
+
+def decode_frame(
+    frame: bytes,
+) -> Message | HeartbeatPayload | AcknowledgmentPayload:
+    try:
+        decoded = _decode_json(frame.decode("utf-8", errors="replace"))
+    except ValueError:
+        return Message.from_serial(frame)
+    if isinstance(decoded, dict):
+        message_type = decoded.get("type")
+        payload = decoded.get("payload")
+        if isinstance(message_type, str) and isinstance(payload, dict):
+            if payload_decoder := _PAYLOAD_DECODERS.get(message_type):
+                return payload_decoder.from_payload(payload)
+    return Message.from_decoded(decoded, frame)
+
+
 class ResponseMessage(Message):
     def is_success(self) -> bool:
         return self.type == MessageType.RESPONSE_SUCCESS
@@ -209,5 +334,5 @@ class Response(BaseModel):
         return cls(success=True, message=f"Event: {msg.type}", data=msg.payload)
 
     @classmethod
-    def from_serial(cls, data: str) -> "Response":
+    def from_serial(cls, data: str | bytes) -> "Response":
         return cls.from_message(Message.from_serial(data))
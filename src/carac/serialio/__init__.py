@@ -1,9 +1,15 @@
 from .arduino_client import ArduinoClient
-from .ports import get_available_ports, get_arduino_ports, is_arduino_port
+from .ports import (
+    get_arduino_ports,
+    get_available_ports,
+    invalidate_port_cache,
+    is_arduino_port,
+)
 
 __all__ = [
     "ArduinoClient",
     "get_available_ports",
     "get_arduino_ports",
+    "invalidate_port_cache",
     "is_arduino_port",
 ]
\ No newline at end of file
@@ -1,5 +1,12 @@
+import os
+import random
+import selectors
 import time
-from threading import Event, Lock, Thread
+from dataclasses import dataclass
+from functools import partial
+from itertools import count
+from queue import Empty, SimpleQueue
+from threading import Condition, Event, Lock, Thread
 from typing import Callable
 
 import serial
@@ -7,8 +14,10 @@ from loguru import logger
 
 from ..config.settings import settings
 from ..protocol.models import (
+    AcknowledgmentPayload,
     CameraTriggerCommand,
     ConnectionStatus,
+    HeartbeatPayload,
     LightingSetCommand,
     Message,
     MessageType,
@@ -22,9 +31,42 @@ from ..protocol.models import (
     SystemResetCommand,
     SystemStatusCommand,
     TestLedToggleCommand,
+    decode_frame,
 )
 from .connection_monitor import AcknowledgmentInfo, ConnectionHealth, ConnectionMonitor
 
+_JSON_START = b"{"
+_FRAME_DELIMITER = b"\n"
+_HEARTBEAT_MARKER = b'"event_heartbeat"'
+_EVENT_PREFIX = "event_"
+_RESPONSE_TYPES = frozenset(
+    {
+        MessageType.RESPONSE_SUCCESS,
+        MessageType.RESPONSE_ERROR,
+        MessageType.RESPONSE_STATUS,
+    }
+)
+_COMMAND_ECHO_TYPES = frozenset(
+    {
+        MessageType.LIGHTING_SET,
+        MessageType.MOTOR_POSITION,
+        MessageType.MOTOR_FLIP,
+        MessageType.CAMERA_TRIGGER,
+        MessageType.TEST_LED_TOGGLE,
+        MessageType.SET_BACKLIGHT,
+    }
+)
+
+
+def _frame_text(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace").strip()
+
+
+@dataclass(slots=True)
+class _PendingResponse:
+    done: bool = False
+    response: Response | None = None
+
 
 class ArduinoClient:
     DEFAULT_COMMAND_TIMEOUT = 2.0
@@ -33,127 +75,263 @@ class ArduinoClient:
     READ_LOOP_DELAY = 0.05
     THREAD_JOIN_TIMEOUT = 1.0
     COMMUNICATION_TEST_TIMEOUT = 5.0
-    JSON_START_CHAR = "{"
-    ACK_PREFIX = "ACK:"
+    RX_BUFFER_LIMIT = 64 * 1024
+    READ_CHUNK_SIZE = 4096
+    OS_RX_BUFFER_SIZE = 64 * 1024
+    OS_TX_BUFFER_SIZE = 64 * 1024
+    MAX_QUEUED_FRAMES = 256
+    FRAME_QUEUE_LIMIT = 1024
     MAX_CONSECUTIVE_ERRORS = 10
     ERROR_DELAY_MULTIPLIER = 2
+    MAX_ERROR_DELAY = 0.5
+    RECONNECT_BACKOFF_INITIAL = 0.1
+    RECONNECT_BACKOFF_MAX = 30.0
+    RECONNECT_JITTER = 0.1
+    MAX_RECONNECT_ATTEMPTS = 10
+    ERROR_LOG_BURST = 3
+    ERROR_LOG_INTERVAL = 30.0
 
     def __init__(self) -> None:
         self._serial: serial.Serial | None = None
+        self._port: str | None = None
+        self._baud_rate: int | None = None
+        self._reconnect_backoff = self.RECONNECT_BACKOFF_INITIAL
+        self._error_log_count = 0
+        self._last_error_log_time = 0.0
         self._status = ConnectionStatus.DISCONNECTED
-        self._lock = Lock()
+        self._write_lock = Lock()
         self._read_thread: Thread | None = None
-        self._stop_reading = False
+        self._parse_thread: Thread | None = None
+        self._rx_buffer = bytearray()
+        self._rx_frames: SimpleQueue[bytes | None] = SimpleQueue()
+        self._stop_event = Event()
+        self._ready_event = Event()
         self._response_callback: Callable[[Response], None] | None = None
         self._event_callback: Callable[[Message], None] | None = None
-        self._pending_response: Response | None = None
-        self._response_event = Event()
+        self._status_callback: Callable[[ConnectionStatus], None] | None = None
+        self._sequence = count(1)
+        self._pending: dict[int, _PendingResponse] = {}
+        self._pending_changed = Condition()
         self._command_timeout = self.DEFAULT_COMMAND_TIMEOUT
         self._last_sent_command_type: str | None = None
         self._connection_monitor = ConnectionMonitor()
         self._heartbeat_callback: Callable[[ConnectionHealth], None] | None = None
         self._ack_callback: Callable[[AcknowledgmentInfo], None] | None = None
+        self._message_handlers = self._build_message_handlers()
+
+    def _build_message_handlers(self) -> dict[str, Callable[[Message], None]]:
+        handlers: dict[str, Callable[[Message], None]] = {
+            message_type: self._route_event
+            for message_type in MessageType
+            if message_type.startswith(_EVENT_PREFIX)
+        }
+        handlers[MessageType.EVENT_STATUS] = self._route_event
+        handlers[MessageType.EVENT_HEARTBEAT] = self._handle_heartbeat
+        handlers[MessageType.RESPONSE_ACK] = self._handle_acknowledgment
+        for message_type in _RESPONSE_TYPES:
+            handlers[message_type] = self._route_response_message
+        return handlers
 
     def connect(self, port: str, baud_rate: int | None = None) -> bool:
         if self._status == ConnectionStatus.CONNECTED:
             logger.warning("Already connected to Arduino")
             return True
+        if self._read_thread and self._read_thread.is_alive():
+            self.disconnect()
         try:
             self._status = ConnectionStatus.CONNECTING
             baud_rate = baud_rate or settings.default_baud_rate
             logger.info(f"Connecting to Arduino on {port} at {baud_rate} baud")
-            self._serial = serial.Serial(
-                port=port,
-                baudrate=baud_rate,
-                timeout=settings.default_timeout,
-                write_timeout=settings.default_timeout,
-            )
-            time.sleep(self.RECONNECT_DELAY)
+            self._port = port
+            self._baud_rate = baud_rate
+            self._reconnect_backoff = self.RECONNECT_BACKOFF_INITIAL
+            self._error_log_count = 0
+            self._serial = self._open_port(port, baud_rate)
             if not self._serial.is_open:
                 self._status = ConnectionStatus.ERROR
                 logger.error("Failed to open serial connection")
                 return False
+            self._ready_event.clear()
             self._status = ConnectionStatus.CONNECTED
             logger.info("Successfully connected to Arduino")
             self._start_reading()
             self._connection_monitor.start_monitoring()
-            time.sleep(self.HANDSHAKE_DELAY)
+            if not self._ready_event.wait(
+                timeout=self.RECONNECT_DELAY + self.HANDSHAKE_DELAY
+            ):
+                logger.debug("No message from Arduino yet, continuing after handshake delay")
             return True
         except Exception as e:
             self._status = ConnectionStatus.ERROR
             logger.error(f"Error connecting to Arduino: {e}")
             return False
 
+    def _open_port(self, port: str, baud_rate: int) -> serial.Serial:
+        serial_port = serial.Serial(
+            port=port,
+            baudrate=baud_rate,
+            timeout=settings.default_timeout,
+            write_timeout=settings.default_timeout,
+        )
+        self._configure_port_buffers(serial_port)
+        self._enable_low_latency(serial_port)
+        return serial_port
+
+    def _configure_port_buffers(self, serial_port: serial.Serial) -> None:
+        set_buffer_size = getattr(serial_port, "set_buffer_size", None)
+        if set_buffer_size is None:
+            return
+        try:
+            set_buffer_size(
+                rx_size=self.OS_RX_BUFFER_SIZE, tx_size=self.OS_TX_BUFFER_SIZE
+            )
+        except (serial.SerialException, ValueError) as e:
+            logger.warning(f"Could not resize serial driver buffers: {e}")
+
+    def _enable_low_latency(self, serial_port: serial.Serial) -> None:
+        set_low_latency_mode = getattr(serial_port, "set_low_latency_mode", None)
+        if set_low_latency_mode is None:
+            return
+        try:
+            set_low_latency_mode(True)
+            logger.debug("Enabled low-latency mode on serial port")
+        except (serial.SerialException, ValueError) as e:
+            logger.debug(f"Serial driver does not support low-latency mode: {e}")
+
     def disconnect(self) -> None:
         self._connection_monitor.stop_monitoring()
-        with self._lock:
+        with self._write_lock:
+            self._stop_event.set()
+            self._release_pending()
+            if self._serial and self._serial.is_open:
+                self._cancel_read(self._serial)
+            if self._read_thread and self._read_thread.is_alive():
+                self._read_thread.join(timeout=self.THREAD_JOIN_TIMEOUT)
+            if self._parse_thread and self._parse_thread.is_alive():
+                self._rx_frames.put(None)
+                self._parse_thread.join(timeout=self.THREAD_JOIN_TIMEOUT)
             if self._serial and self._serial.is_open:
-                self._stop_reading = True
-                self._response_event.set()
-                if self._read_thread and self._read_thread.is_alive():
-                    self._read_thread.join(timeout=self.THREAD_JOIN_TIMEOUT)
+                self._drain_output(self._serial)
                 self._serial.close()
                 logger.info("Disconnected from Arduino")
             self._serial = None
             self._status = ConnectionStatus.DISCONNECTED
-            self._pending_response = None
-            self._response_event.clear()
+            self._release_pending()
             self._last_sent_command_type = None
+            self._rx_buffer.clear()
+
+    def _cancel_read(self, serial_port: serial.Serial) -> None:
+        cancel_read = getattr(serial_port, "cancel_read", None)
+        if cancel_read is None:
+            return
+        try:
+            cancel_read()
+        except (serial.SerialException, OSError) as e:
+            logger.debug(f"Could not cancel pending serial read: {e}")
+
+    def _drain_output(self, serial_port: serial.Serial) -> None:
+        try:
+            serial_port.flush()
+        except (serial.SerialException, OSError) as e:
+            logger.debug(f"Could not drain pending output before closing: {e}")
 
     def send_command(self, command: Message) -> Response | None:
+        return self.send_batch([command])[0]
+
+    def send_batch(self, commands: list[Message]) -> list[Response | None]:
+        if not commands:
+            return []
         if not self._serial or not self._serial.is_open:
             logger.error("Not connected to ESP32")
-            return None
+            return [None] * len(commands)
+        waiting: dict[int, _PendingResponse] = {}
         try:
-            with self._lock:
-                self._pending_response = None
-                self._response_event.clear()
-                self._last_sent_command_type = command.type
-                command_data = command.to_serial()
-                logger.debug(
-                    f"Sending command - Type: {command.type}, Data: {command_data.strip()}"
+            lazy_logger = logger.opt(lazy=True)
+            frames: list[bytes] = []
+            for command in commands:
+                seq = next(self._sequence)
+                waiting[seq] = _PendingResponse()
+                command_data = command.to_bytes(seq)
+                command_text = partial(_frame_text, command_data)
+                lazy_logger.debug(
+                    "Sending command - Type: {}, Data: {}",
+                    partial(str, command.type),
+                    command_text,
                 )
-                logger.info(f"→ ESP32: {command_data.strip()}")
-                self._connection_monitor.register_command_sent(command.type)
-                self._serial.write(command_data.encode("utf-8"))
-                self._serial.flush()
-            if not self._response_event.wait(timeout=self._command_timeout):
-                logger.warning("No response received from ESP32 within timeout")
-                return None
-            with self._lock:
-                response = self._pending_response
-                self._pending_response = None
-                if response:
-                    logger.info(f"← ESP32: {response}")
-                else:
-                    logger.warning("Response event triggered but no response data")
-                return response
+                lazy_logger.info("→ ESP32: {}", command_text)
+                frames.append(command_data)
+            batch = b"".join(frames)
+            with self._write_lock:
+                self._last_sent_command_type = commands[-1].type
+                with self._pending_changed:
+                    self._pending.update(waiting)
+                for command in commands:
+                    self._connection_monitor.register_command_sent(command.type)
+                self._serial.write(batch)
+            return self._collect_responses(waiting)
         except Exception as e:
             logger.error(f"Error sending command: {e}")
-            return None
+            self._discard_pending(waiting)
+            return [None] * len(commands)
 
     def send_command_async(self, command: Message) -> bool:
         if not self._serial or not self._serial.is_open:
             logger.error("Not connected to ESP32")
             return False
         try:
-            with self._lock:
+            command_data = command.to_bytes(next(self._sequence))
+            command_text = partial(_frame_text, command_data)
+            lazy_logger = logger.opt(lazy=True)
+            lazy_logger.debug(
+                "Sending command (async) - Type: {}, Data: {}",
+                partial(str, command.type),
+                command_text,
+            )
+            lazy_logger.info("→ ESP32 (async): {}", command_text)
+            with self._write_lock:
                 self._last_sent_command_type = command.type
-                command_data = command.to_serial()
-                logger.debug(
-                    f"Sending command (async) - Type: {command.type}, Data: {command_data.strip()}"
-                )
-                logger.info(f"→ ESP32 (async): {command_data.strip()}")
                 self._connection_monitor.register_command_sent(command.type)
-                self._serial.write(command_data.encode("utf-8"))
-                self._serial.flush()
+                self._serial.write(command_data)
             return True
         except Exception as e:
             logger.error(f"Error sending command async: {e}")
             return False
 
+    def _collect_responses(
+        self, waiting: dict[int, _PendingResponse]
+    ) -> list[Response | None]:
+        with self._pending_changed:
+            self._pending_changed.wait_for(
+                lambda: all(pending.done for pending in waiting.values()),
+                timeout=self._command_timeout * len(waiting),
+            )
+            for seq in waiting:
+                self._pending.pop(seq, None)
+        responses: list[Response | None] = []
+        for pending in waiting.values():
+            if pending.response:
+                logger.info("← ESP32: {}", pending.response)
+            elif pending.done:
+                logger.warning("Response event triggered but no response data")
+            else:
+                logger.warning("No response received from ESP32 within timeout")
+            responses.append(pending.response)
+        return responses
+
+    def _discard_pending(self, waiting: dict[int, _PendingResponse]) -> None:
+        with self._pending_changed:
+            for seq in waiting:
+                self._pending.pop(seq, None)
+
+    def _release_pending(self) -> None:
+        with self._pending_changed:
+            for entry in self._pending.values():
+                entry.done = True
+            self._pending.clear()
+            self._pending_changed.notify_all()
+
     def ping(self) -> bool:
-        response = self.send_command(SystemPingCommand.create())
+        response = self.send_command(SystemPingCommand.shared())
         return response is not None and response.success
 
     def test_communication(self) -> bool:
@@ -173,7 +351,7 @@ class ArduinoClient:
             self._command_timeout = original_timeout
 
     def get_status(self) -> Response | None:
-        return self.send_command(SystemStatusCommand.create())
+        return self.send_command(SystemStatusCommand.shared())
 
     def set_lighting(self, channel: str, intensity: int) -> Response | None:
         return self.send_command(LightingSetCommand.create(channel, intensity))
@@ -195,7 +373,7 @@ class ArduinoClient:
         )
 
     def toggle_led(self) -> Response | None:
-        return self.send_command(TestLedToggleCommand.create())
+        return self.send_command(TestLedToggleCommand.shared())
 
     def set_backlight(self, enabled: bool) -> Response | None:
         return self.send_command(SetBacklightCommand.create(enabled))
@@ -204,16 +382,16 @@ class ArduinoClient:
         return self.send_command(MotorPositionCommand.create(direction, steps))
 
     def motor_flip(self) -> Response | None:
-        return self.send_command(MotorFlipCommand.create())
+        return self.send_command(MotorFlipCommand.shared())
 
     def camera_trigger(self, duration: int | None = None) -> Response | None:
         return self.send_command(CameraTriggerCommand.create(duration))
 
     def emergency_stop(self) -> Response | None:
-        return self.send_command(SystemEmergencyStopCommand.create())
+        return self.send_command(SystemEmergencyStopCommand.shared())
 
     def reset_system(self) -> Response | None:
-        return self.send_command(SystemResetCommand.create())
+        return self.send_command(SystemResetCommand.shared())
 
     def set_response_callback(self, callback: Callable[[Response], None]) -> None:
         self._response_callback = callback
@@ -221,6 +399,11 @@ class ArduinoClient:
     def set_event_callback(self, callback: Callable[[Message], None]) -> None:
         self._event_callback = callback
 
+    def set_status_callback(
+        self, callback: Callable[[ConnectionStatus], None]
+    ) -> None:
+        self._status_callback = callback
+
     def set_heartbeat_callback(
         self, callback: Callable[[ConnectionHealth], None]
     ) -> None:
@@ -235,111 +418,278 @@ class ArduinoClient:
         return self._connection_monitor.get_health()
 
     def _start_reading(self) -> None:
-        self._stop_reading = False
+        self._stop_event.clear()
+        self._rx_frames = SimpleQueue()
+        self._parse_thread = Thread(target=self._parse_loop, daemon=True)
+        self._parse_thread.start()
         self._read_thread = Thread(target=self._read_loop, daemon=True)
         self._read_thread.start()
 
     def _read_loop(self) -> None:
+        serial_port = self._serial
+        while serial_port is not None and self._read_port(serial_port):
+            serial_port = self._reopen_port(serial_port)
+        self._rx_frames.put(None)
+        logger.debug("Read loop stopped")
+
+    def _read_port(self, serial_port: serial.Serial) -> bool:
+        stop_event = self._stop_event
+        selector = self._create_read_selector(serial_port)
+        read_delay = self.READ_LOOP_DELAY
+        error_delay = read_delay
         consecutive_errors = 0
-        while not self._stop_reading and self._serial and self._serial.is_open:
-            try:
-                self._process_serial_data()
-                consecutive_errors = 0
-                time.sleep(self.READ_LOOP_DELAY)
-            except Exception as e:
-                consecutive_errors += 1
-                logger.error(
-                    f"Error in read loop: {e} (consecutive errors: {consecutive_errors})"
-                )
-                if consecutive_errors >= self.MAX_CONSECUTIVE_ERRORS:
-                    logger.error(
-                        f"Too many consecutive errors ({consecutive_errors}), stopping read loop"
+        try:
+            while not stop_event.is_set() and serial_port.is_open:
+                try:
+                    if selector is None:
+                        self._read_serial_data(serial_port)
+                    elif selector.select(read_delay):
+                        self._read_ready_data(serial_port.fileno())
+                    if consecutive_errors or self._error_log_count:
+                        consecutive_errors = 0
+                        error_delay = read_delay
+                        self._error_log_count = 0
+                        self._reconnect_backoff = self.RECONNECT_BACKOFF_INITIAL
+                except serial.SerialException as e:
+                    if stop_event.is_set():
+                        break
+                    self._log_read_error(f"Serial port failure, reconnecting: {e}")
+                    return True
+                except Exception as e:
+                    consecutive_errors += 1
+                    self._log_read_error(
+                        f"Error in read loop: {e} (consecutive errors: {consecutive_errors})"
                     )
-                    break
-                time.sleep(self.READ_LOOP_DELAY * self.ERROR_DELAY_MULTIPLIER)
-        logger.debug("Read loop stopped")
+                    if consecutive_errors >= self.MAX_CONSECUTIVE_ERRORS:
+                        logger.error(
+                            f"Too many consecutive errors ({consecutive_errors}), stopping read loop"
+                        )
+                        break
+                    error_delay = min(
+                        error_delay * self.ERROR_DELAY_MULTIPLIER, self.MAX_ERROR_DELAY
+                    )
+                    stop_event.wait(error_delay)
+        finally:
+            if selector:
+                selector.close()
+        return False
 
-    def _process_serial_data(self) -> None:
-        if not self._serial or self._serial.in_waiting <= 0:
-            return
+    def _reopen_port(self, failed_port: serial.Serial) -> serial.Serial | None:
+        self._set_status(ConnectionStatus.CONNECTING)
+        self._release_pending()
         try:
-            data = (
-                self._serial.readline()
-                .decode("utf-8", errors="ignore")
-                .strip()
+            failed_port.close()
+        except (serial.SerialException, OSError) as e:
+            logger.debug(f"Error closing failed serial port: {e}")
+        self._rx_buffer.clear()
+        if self._port is None or self._baud_rate is None:
+            self._set_status(ConnectionStatus.ERROR)
+            return None
+        stop_event = self._stop_event
+        for attempt in range(1, self.MAX_RECONNECT_ATTEMPTS + 1):
+            if stop_event.wait(
+                self._reconnect_backoff + random.uniform(0, self.RECONNECT_JITTER)
+            ):
+                return None
+            self._reconnect_backoff = min(
+                self._reconnect_backoff * self.ERROR_DELAY_MULTIPLIER,
+                self.RECONNECT_BACKOFF_MAX,
             )
-        except UnicodeDecodeError as e:
-            logger.warning(f"Failed to decode serial data: {e}")
+            try:
+                serial_port = self._open_port(self._port, self._baud_rate)
+            except (serial.SerialException, OSError, ValueError) as e:
+                self._log_read_error(f"Reconnect attempt {attempt} failed: {e}")
+                continue
+            if stop_event.is_set():
+                serial_port.close()
+                return None
+            self._serial = serial_port
+            self._set_status(ConnectionStatus.CONNECTED)
+            logger.info(
+                f"Reconnected to Arduino on {self._port} after {attempt} attempt(s)"
+            )
+            return serial_port
+        logger.error(
+            f"Giving up on {self._port} after {self.MAX_RECONNECT_ATTEMPTS} "
+            "reconnect attempts"
+        )
+        self._set_status(ConnectionStatus.ERROR)
+        return None
+
+    def _set_status(self, status: ConnectionStatus) -> None:
+        self._status = status
+        callback = self._status_callback
+        if callback is None:
             return
+        try:
+            callback(status)
+        except Exception as e:
+            logger.error(f"Error in status callback: {e}")
+
+    def _log_read_error(self, message: str) -> None:
+        now = time.monotonic()
+        self._error_log_count += 1
         if (
-            not data
-            or data.startswith(self.ACK_PREFIX)
-            or not data.startswith(self.JSON_START_CHAR)
+            self._error_log_count <= self.ERROR_LOG_BURST
+            or now - self._last_error_log_time >= self.ERROR_LOG_INTERVAL
         ):
-            logger.debug(f"Ignoring non-JSON message: {data}")
+            self._last_error_log_time = now
+            logger.error(message)
+
+    def _create_read_selector(
+        self, serial_port: serial.Serial
+    ) -> selectors.BaseSelector | None:
+        try:
+            selector = selectors.DefaultSelector()
+            selector.register(serial_port.fileno(), selectors.EVENT_READ)
+        except (AttributeError, OSError, TypeError, ValueError):
+            logger.debug("Serial port is not selectable, using blocking reads instead")
+            return None
+        return selector
+
+    def _read_ready_data(self, fd: int) -> None:
+        try:
+            data = os.read(fd, self.READ_CHUNK_SIZE)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            raise serial.SerialException(f"read failed: {e}") from e
+        if not data:
+            raise serial.SerialException(
+                "device reports readiness to read but returned no data "
+                "(device disconnected or multiple access on port?)"
+            )
+        self._consume_serial_data(data)
+
+    def _read_serial_data(self, serial_port: serial.Serial) -> None:
+        data = serial_port.read(serial_port.in_waiting or 1)
+        if not data:
             return
-        logger.debug(f"RAW ESP32: {repr(data)}")
-        message = Message.from_serial(data)
-        logger.debug(f"Parsed message: type={message.type}")
-        self._route_message(message)
+        if (pending := serial_port.in_waiting) > 0:
+            data += serial_port.read(pending)
+        self._consume_serial_data(data)
+
+    def _consume_serial_data(self, data: bytes) -> None:
+        rx_buffer = self._rx_buffer
+        unscanned = len(rx_buffer)
+        rx_buffer += data
+        enqueue_frame = self._enqueue_frame
+        start = 0
+        newline = rx_buffer.find(_FRAME_DELIMITER, unscanned)
+        with memoryview(rx_buffer) as view:
+            while newline != -1:
+                frame = bytes(view[start:newline]).strip()
+                start = newline + 1
+                if frame[:1] == _JSON_START:
+                    enqueue_frame(frame)
+                elif frame:
+                    logger.debug("Ignoring non-JSON message: {!r}", frame)
+                newline = rx_buffer.find(_FRAME_DELIMITER, start)
+        if start:
+            del rx_buffer[:start]
+        if len(rx_buffer) > self.RX_BUFFER_LIMIT:
+            logger.warning(
+                f"Discarding {len(rx_buffer)} buffered bytes without a frame delimiter"
+            )
+            rx_buffer.clear()
+
+    def _enqueue_frame(self, frame: bytes) -> None:
+        rx_frames = self._rx_frames
+        queued = rx_frames.qsize()
+        if queued >= self.MAX_QUEUED_FRAMES:
+            if _HEARTBEAT_MARKER in frame:
+                logger.warning("Frame queue backlogged, dropping heartbeat")
+                return
+            if queued >= self.FRAME_QUEUE_LIMIT and not self._pending:
+                try:
+                    rx_frames.get_nowait()
+                    logger.warning("Frame queue full, dropping oldest frame")
+                except Empty:
+                    pass
+        rx_frames.put(frame)
+
+    def _parse_loop(self) -> None:
+        while (frame := self._rx_frames.get()) is not None:
+            self._handle_frame(frame)
+        logger.debug("Parse loop stopped")
+
+    def _handle_frame(self, frame: bytes) -> None:
+        try:
+            self._process_frame(frame)
+        except Exception as e:
+            logger.error(f"Error processing frame: {e}")
+
+    def _process_frame(self, frame: bytes) -> None:
+        if not self._ready_event.is_set():
+            self._ready_event.set()
+        logger.debug("RAW ESP32: {!r}", frame)
+        decoded = decode_frame(frame)
+        if isinstance(decoded, HeartbeatPayload):
+            self._apply_heartbeat(decoded)
+        elif isinstance(decoded, AcknowledgmentPayload):
+            self._apply_acknowledgment(decoded)
+        else:
+            logger.debug("Parsed message: type={}", decoded.type)
+            self._route_message(decoded)
 
     def _route_message(self, message: Message) -> None:
-        if message.type == MessageType.EVENT_HEARTBEAT:
-            self._handle_heartbeat(message)
-        elif message.type == MessageType.RESPONSE_ACK:
-            self._handle_acknowledgment(message)
-        elif message.type in (
-            MessageType.RESPONSE_SUCCESS,
-            MessageType.RESPONSE_ERROR,
-            MessageType.RESPONSE_STATUS,
-        ):
-            self._route_response(Response.from_message(message))
-        elif message.type.startswith("event_") or message.type == MessageType.EVENT_STATUS:
+        self._message_handlers.get(message.type, self._route_unhandled)(message)
+
+    def _route_unhandled(self, message: Message) -> None:
+        if message.type.startswith(_EVENT_PREFIX):
             self._route_event(message)
         elif (
             self._last_sent_command_type
             and message.type == self._last_sent_command_type
         ):
-            logger.debug(f"Received command echo confirmation: {message.type}")
+            logger.debug("Received command echo confirmation: {}", message.type)
             self._last_sent_command_type = None
             self._route_response(
                 Response(
                     success=True,
                     message=f"Command '{message.type}' confirmed",
                     data=message.payload,
-                )
+                ),
+                message.seq,
             )
-        elif message.type in (
-            MessageType.LIGHTING_SET,
-            MessageType.MOTOR_POSITION,
-            MessageType.MOTOR_FLIP,
-            MessageType.CAMERA_TRIGGER,
-            MessageType.TEST_LED_TOGGLE,
-            MessageType.SET_BACKLIGHT,
-        ):
+        elif message.type in _COMMAND_ECHO_TYPES:
             has_error = (
                 "error" in message.payload or "error_code" in message.payload
             )
             logger.debug(
-                f"Received command echo response: {message.type} (success={not has_error})"
+                "Received command echo response: {} (success={})",
+                message.type,
+                not has_error,
             )
             self._route_response(
                 Response(
                     success=not has_error,
                     message=f"Command '{message.type}' {'confirmed' if not has_error else 'failed'}",
                     data=message.payload,
-                )
+                ),
+                message.seq,
             )
         else:
-            logger.warning(f"Received unexpected message type: {message.type}")
-
-    def _route_response(self, response: Response) -> None:
-        with self._lock:
-            if not self._response_event.is_set() and self._pending_response is None:
-                self._pending_response = response
-                self._response_event.set()
-                logger.debug("Response routed to synchronous command")
-                return
+            logger.warning("Received unexpected message type: {}", message.type)
+
+    def _route_response_message(self, message: Message) -> None:
+        self._route_response(Response.from_message(message), message.seq)
+
+    def _route_response(self, response: Response, seq: int | None = None) -> None:
+        with self._pending_changed:
+            if seq is not None:
+                pending = self._pending.pop(seq, None)
+            elif self._pending:
+                pending = self._pending.pop(next(iter(self._pending)))
+            else:
+                pending = None
+            if pending is not None:
+                pending.response = response
+                pending.done = True
+                self._pending_changed.notify_all()
+        if pending is not None:
+            logger.debug("Response routed to synchronous command")
+            return
         logger.debug("Response routed to async callback")
         if self._response_callback:
             try:
@@ -348,9 +698,9 @@ class ArduinoClient:
                 logger.error(f"Error in async response callback: {e}")
 
     def _route_event(self, event: Message) -> None:
-        logger.info(f"Event received: {event.type}")
+        logger.info("Event received: {}", event.type)
         if not self._event_callback:
-            logger.debug(f"No event callback registered for: {event.type}")
+            logger.debug("No event callback registered for: {}", event.type)
             return
         try:
             self._event_callback(event)
@@ -358,16 +708,16 @@ class ArduinoClient:
             logger.error(f"Error in event callback: {e}")
 
     def _handle_heartbeat(self, message: Message) -> None:
-        payload = message.payload
-        uptime = payload.get("uptime", 0)
-        status = payload.get("status", "unknown")
-        self._connection_monitor.handle_heartbeat(uptime, status)
+        self._apply_heartbeat(HeartbeatPayload.from_payload(message.payload))
 
     def _handle_acknowledgment(self, message: Message) -> None:
-        payload = message.payload
-        received_type = payload.get("received_type", "unknown")
-        timestamp = payload.get("timestamp", 0)
-        self._connection_monitor.handle_acknowledgment(received_type, timestamp)
+        self._apply_acknowledgment(AcknowledgmentPayload.from_payload(message.payload))
+
+    def _apply_heartbeat(self, heartbeat: HeartbeatPayload) -> None:
+        self._connection_monitor.handle_heartbeat(heartbeat.uptime, heartbeat.status)
+
+    def _apply_acknowledgment(self, ack: AcknowledgmentPayload) -> None:
+        self._connection_monitor.handle_acknowledgment(ack.received_type, ack.timestamp)
 
     @property
     def is_connected(self) -> bool:
@@ -1,6 +1,6 @@
 import time
-from dataclasses import dataclass, field
-from threading import Lock, Thread
+from dataclasses import dataclass, field, replace
+from threading import Event, Lock, Thread
 from typing import Callable
 
 from loguru import logger
@@ -8,7 +8,7 @@ from loguru import logger
 from ..config.settings import settings
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConnectionHealth:
     is_alive: bool = False
     last_heartbeat_time: float = 0.0
@@ -21,13 +21,14 @@ class ConnectionHealth:
 class AcknowledgmentInfo:
     received_type: str
     timestamp: int
-    sent_time: float = field(default_factory=time.time)
+    sent_time: float = field(default_factory=time.monotonic)
     round_trip_ms: float = 0.0
 
 
 class ConnectionMonitor:
-    CHECK_INTERVAL_SECONDS = 2.0
     THREAD_JOIN_TIMEOUT_SECONDS = 2.0
+    TIMEOUT_CHECK_MARGIN_SECONDS = 0.01
+    HEARTBEAT_BROADCAST_INTERVAL_SECONDS = 0.5
 
     @property
     def heartbeat_timeout_seconds(self) -> float:
@@ -42,8 +43,10 @@ class ConnectionMonitor:
         self._health = ConnectionHealth()
         self._monitoring = False
         self._monitor_thread: Thread | None = None
+        self._wake = Event()
         self._pending_acks: dict[str, float] = {}
         self._last_ack: AcknowledgmentInfo | None = None
+        self._last_heartbeat_broadcast = 0.0
         self._heartbeat_callback: Callable[[ConnectionHealth], None] | None = None
         self._timeout_callback: Callable[[], None] | None = None
         self._ack_callback: Callable[[AcknowledgmentInfo], None] | None = None
@@ -54,6 +57,7 @@ class ConnectionMonitor:
             return
         logger.info("Starting connection monitoring")
         self._monitoring = True
+        self._wake.clear()
         self._monitor_thread = Thread(target=self._monitor_loop, daemon=True)
         self._monitor_thread.start()
 
@@ -62,44 +66,49 @@ class ConnectionMonitor:
             return
         logger.info("Stopping connection monitoring")
         self._monitoring = False
+        self._wake.set()
         if self._monitor_thread and self._monitor_thread.is_alive():
             self._monitor_thread.join(timeout=self.THREAD_JOIN_TIMEOUT_SECONDS)
         with self._lock:
             self._health = ConnectionHealth()
             self._pending_acks.clear()
             self._last_ack = None
+            self._last_heartbeat_broadcast = 0.0
 
     def handle_heartbeat(self, uptime_ms: int, status: str) -> None:
-        current_time = time.time()
+        now = time.monotonic()
         with self._lock:
             previous_alive = self._health.is_alive
-            self._health.is_alive = True
-            self._health.last_heartbeat_time = current_time
-            self._health.esp32_uptime_ms = uptime_ms
-            self._health.seconds_since_heartbeat = 0.0
-            self._health.heartbeat_count += 1
-            health_snapshot = ConnectionHealth(
-                is_alive=self._health.is_alive,
-                last_heartbeat_time=self._health.last_heartbeat_time,
-                esp32_uptime_ms=self._health.esp32_uptime_ms,
-                seconds_since_heartbeat=self._health.seconds_since_heartbeat,
-                heartbeat_count=self._health.heartbeat_count,
+            heartbeat_count = self._health.heartbeat_count + 1
+            self._health = health_snapshot = ConnectionHealth(
+                is_alive=True,
+                last_heartbeat_time=now,
+                esp32_uptime_ms=uptime_ms,
+                heartbeat_count=heartbeat_count,
+            )
+            callback = self._heartbeat_callback
+            broadcast = callback is not None and (
+                not previous_alive
+                or now - self._last_heartbeat_broadcast
+                >= self.HEARTBEAT_BROADCAST_INTERVAL_SECONDS
             )
+            if broadcast:
+                self._last_heartbeat_broadcast = now
         if not previous_alive:
+            self._wake.set()
             logger.info("Connection restored - heartbeat received")
         logger.debug(
-            f"Heartbeat #{health_snapshot.heartbeat_count}: "
-            f"uptime={uptime_ms}ms, status={status}"
+            "Heartbeat #{}: uptime={}ms, status={}", heartbeat_count, uptime_ms, status
         )
-        if not self._heartbeat_callback:
+        if callback is None or not broadcast:
             return
         try:
-            self._heartbeat_callback(health_snapshot)
+            callback(health_snapshot)
         except Exception as e:
             logger.error(f"Error in heartbeat callback: {e}")
 
     def handle_acknowledgment(self, received_type: str, timestamp: int) -> None:
-        current_time = time.time()
+        current_time = time.monotonic()
         with self._lock:
             sent_time = self._pending_acks.pop(received_type, current_time)
             round_trip_ms = (current_time - sent_time) * 1000
@@ -110,7 +119,9 @@ class ConnectionMonitor:
                 round_trip_ms=round_trip_ms,
             )
             self._last_ack = ack_info
-        logger.debug(f"✓ ACK for '{received_type}' (RTT: {round_trip_ms:.1f}ms)")
+        logger.debug(
+            "✓ ACK for '{}' (RTT: {:.1f}ms)", received_type, round_trip_ms
+        )
         if not self._ack_callback:
             return
         try:
@@ -120,17 +131,18 @@ class ConnectionMonitor:
 
     def register_command_sent(self, command_type: str) -> None:
         with self._lock:
-            self._pending_acks[command_type] = time.time()
+            self._pending_acks[command_type] = time.monotonic()
 
     def get_health(self) -> ConnectionHealth:
+        current_time = time.monotonic()
         with self._lock:
-            return ConnectionHealth(
-                is_alive=self._health.is_alive,
-                last_heartbeat_time=self._health.last_heartbeat_time,
-                esp32_uptime_ms=self._health.esp32_uptime_ms,
-                seconds_since_heartbeat=self._health.seconds_since_heartbeat,
-                heartbeat_count=self._health.heartbeat_count,
-            )
+            health = self._health
+        if health.last_heartbeat_time <= 0:
+            return health
+        return replace(
+            health,
+            seconds_since_heartbeat=current_time - health.last_heartbeat_time,
+        )
 
     def get_last_acknowledgment(self) -> AcknowledgmentInfo | None:
         with self._lock:
@@ -149,32 +161,24 @@ class ConnectionMonitor:
 
     def _monitor_loop(self) -> None:
         while self._monitoring:
-            self._check_heartbeat_timeout(time.time())
-            time.sleep(self.CHECK_INTERVAL_SECONDS)
+            self._wake.wait(self._check_heartbeat_timeout(time.monotonic()))
+            self._wake.clear()
 
-    def _check_heartbeat_timeout(self, current_time: float) -> None:
-        health_snapshot = None
-        timeout_detected = False
+    def _check_heartbeat_timeout(self, current_time: float) -> float | None:
         with self._lock:
-            if self._health.last_heartbeat_time <= 0:
-                return
+            if not self._health.is_alive or self._health.last_heartbeat_time <= 0:
+                return None
             elapsed = current_time - self._health.last_heartbeat_time
-            self._health.seconds_since_heartbeat = elapsed
-            if self._health.is_alive and elapsed > self.heartbeat_timeout_seconds:
-                self._health.is_alive = False
-                timeout_detected = True
-                logger.warning(
-                    f"Connection timeout detected (no heartbeat for {elapsed:.1f}s)"
-                )
-                health_snapshot = ConnectionHealth(
-                    is_alive=self._health.is_alive,
-                    last_heartbeat_time=self._health.last_heartbeat_time,
-                    esp32_uptime_ms=self._health.esp32_uptime_ms,
-                    seconds_since_heartbeat=self._health.seconds_since_heartbeat,
-                    heartbeat_count=self._health.heartbeat_count,
+            if elapsed <= self.heartbeat_timeout_seconds:
+                return (
+                    self.heartbeat_timeout_seconds
+                    - elapsed
+                    + self.TIMEOUT_CHECK_MARGIN_SECONDS
                 )
-        if not timeout_detected or not health_snapshot:
-            return
+            self._health = health_snapshot = replace(
+                self._health, is_alive=False, seconds_since_heartbeat=elapsed
+            )
+        logger.warning(f"Connection timeout detected (no heartbeat for {elapsed:.1f}s)")
         if self._heartbeat_callback:
             try:
                 self._heartbeat_callback(health_snapshot)
@@ -185,6 +189,7 @@ class ConnectionMonitor:
                 self._timeout_callback()
             except Exception as e:
                 logger.error(f"Error in timeout callback: {e}")
+        return None
 
     @property
     def is_alive(self) -> bool:
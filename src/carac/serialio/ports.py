@@ -1,68 +1,146 @@
+import re
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from operator import attrgetter
+from threading import Lock
+
 import serial.tools.list_ports
 from loguru import logger
+from serial.tools.list_ports_common import ListPortInfo
+
+ARDUINO_INDICATORS = ("arduino", "ch340", "cp210", "ftdi", "usb serial")
+ARDUINO_VENDOR_IDS = frozenset(
+    {
+        0x2341,  # Arduino
+        0x2A03,  # Arduino (arduino.org)
+        0x1A86,  # QinHeng CH340
+        0x10C4,  # Silicon Labs CP210x
+        0x0403,  # FTDI
+        0x1B4F,  # SparkFun
+        0x239A,  # Adafruit
+    }
+)
+PORT_CACHE_TTL_SECONDS = 1.0
+
+_ARDUINO_PATTERN = re.compile(
+    "|".join(map(re.escape, ARDUINO_INDICATORS)), re.IGNORECASE
+)
+_ARDUINO_TEXT_FIELDS = ("description", "manufacturer", "product")
+_search_arduino = _ARDUINO_PATTERN.search
+_port_text_fields = attrgetter(*_ARDUINO_TEXT_FIELDS)
+
+
+@dataclass(frozen=True, slots=True)
+class _PortSnapshot:
+    taken_at: float
+    ports: tuple[ListPortInfo, ...]
+    by_device: dict[str, ListPortInfo]
+
 
-ARDUINO_INDICATORS = ["arduino", "ch340", "cp210", "ftdi", "usb serial"]
+_comports_cache: _PortSnapshot | None = None
+_comports_lock = Lock()
 
 
-def get_available_ports() -> list[str]:
+def _port_snapshot(max_age: float = 0.0) -> _PortSnapshot:
+    global _comports_cache
+    with _comports_lock:
+        now = time.monotonic()
+        cached = _comports_cache
+        if max_age > 0 and cached and now - cached.taken_at < max_age:
+            return cached
+        ports = tuple(serial.tools.list_ports.comports())
+        if sys.platform == "win32":
+            ports = _drop_bluetooth_ports(ports)
+        _comports_cache = _PortSnapshot(
+            now, ports, {port.device: port for port in ports}
+        )
+        return _comports_cache
+
+
+def _list_ports(max_age: float = 0.0) -> tuple[ListPortInfo, ...]:
+    return _port_snapshot(max_age).ports
+
+
+def _is_bluetooth_port(port: ListPortInfo) -> bool:
+    return (
+        "BTHENUM" in (port.hwid or "")
+        or "bluetooth" in (port.description or "").lower()
+    )
+
+
+def _drop_bluetooth_ports(
+    ports: tuple[ListPortInfo, ...],
+) -> tuple[ListPortInfo, ...]:
+    kept = []
+    for port in ports:
+        if _is_bluetooth_port(port):
+            logger.trace("Skipping Bluetooth serial port {}", port.device)
+        else:
+            kept.append(port)
+    return tuple(kept)
+
+
+def invalidate_port_cache() -> None:
+    global _comports_cache
+    with _comports_lock:
+        _comports_cache = None
+
+
+def _describes_arduino(fields: Iterable[object]) -> bool:
+    return _search_arduino(" ".join(str(field or "") for field in fields)) is not None
+
+
+def _matches_arduino(port: ListPortInfo) -> bool:
+    return port.vid in ARDUINO_VENDOR_IDS or _describes_arduino(_port_text_fields(port))
+
+
+def get_available_ports(max_age: float = 0.0) -> list[str]:
     try:
-        ports = serial.tools.list_ports.comports()
-        port_list = [port.device for port in ports]
-        logger.debug(f"Found {len(port_list)} serial ports: {port_list}")
+        port_list = [port.device for port in _list_ports(max_age)]
+        logger.debug("Found {} serial ports: {}", len(port_list), port_list)
         return port_list
     except Exception as e:
         logger.error(f"Error detecting serial ports: {e}")
         return []
 
 
-def get_port_info(port: str) -> dict[str, str | int | None] | None:
+def get_port_info(
+    port: str, max_age: float = 0.0
+) -> dict[str, str | int | None] | None:
     try:
-        for p in serial.tools.list_ports.comports():
-            if p.device == port:
-                return {
-                    "device": p.device,
-                    "name": p.name,
-                    "description": p.description,
-                    "hwid": p.hwid,
-                    "vid": p.vid,
-                    "pid": p.pid,
-                    "manufacturer": p.manufacturer,
-                    "product": p.product,
-                }
-        return None
+        if (p := _port_snapshot(max_age).by_device.get(port)) is None:
+            return None
+        return {
+            "device": p.device,
+            "name": p.name,
+            "description": p.description,
+            "hwid": p.hwid,
+            "vid": p.vid,
+            "pid": p.pid,
+            "manufacturer": p.manufacturer,
+            "product": p.product,
+        }
     except Exception as e:
         logger.error(f"Error getting port info for {port}: {e}")
         return None
 
 
-def is_arduino_port(port: str) -> bool:
-    if not (info := get_port_info(port)):
+def is_arduino_port(port: str, max_age: float = 0.0) -> bool:
+    if not (info := get_port_info(port, max_age)):
         return False
-    search_fields = [
-        str(info.get("description", "")).lower(),
-        str(info.get("manufacturer", "")).lower(),
-        str(info.get("product", "")).lower(),
-    ]
-    return any(
-        indicator in field for field in search_fields for indicator in ARDUINO_INDICATORS
-    )
+    if info.get("vid") in ARDUINO_VENDOR_IDS:
+        return True
+    return _describes_arduino(info.get(key) for key in _ARDUINO_TEXT_FIELDS)
 
 
-def get_arduino_ports() -> list[str]:
+def get_arduino_ports(max_age: float = 0.0) -> list[str]:
     try:
-        ports = serial.tools.list_ports.comports()
-        arduino_ports = []
-        for port in ports:
-            search_text = " ".join(
-                [
-                    str(port.description or ""),
-                    str(port.manufacturer or ""),
-                    str(port.product or ""),
-                ]
-            ).lower()
-            if any(indicator in search_text for indicator in ARDUINO_INDICATORS):
-                arduino_ports.append(port.device)
-        logger.info(f"Found {len(arduino_ports)} Arduino ports: {arduino_ports}")
+        arduino_ports = [
+            port.device for port in _list_ports(max_age) if _matches_arduino(port)
+        ]
+        logger.debug("Found {} Arduino ports: {}", len(arduino_ports), arduino_ports)
         return arduino_ports
     except Exception as e:
         logger.error(f"Error detecting Arduino ports: {e}")
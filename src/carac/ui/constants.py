@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -20,7 +21,6 @@ class LayoutConstants:
     TITLE_SECTION_SPACING = 5
     CONTENT_SPACING = 8
     PANEL_SPACING = 5
-    LOG_PANEL_SPACING = 6
 
 
 class SequenceConstants:
@@ -32,17 +32,28 @@ class SequenceConstants:
 class ThrottleConstants:
     LOG_DELAY_MS = 50
     WEIGHT_UPDATE_MS = 100
+    LIGHTING_SEND_MS = 30
 
 
 class LightingConstants:
     NORMALIZATION_FACTOR = 255.0
+    RING_SECTION_KEYS = tuple(
+        (
+            f"ring_{ring}",
+            tuple(f"ring{ring}_section{section}" for section in range(1, 5)),
+        )
+        for ring in range(1, 5)
+    )
+    RING_KEYS = tuple(ring_key for ring_key, _ in RING_SECTION_KEYS)
 
 
 class IconPaths:
     @staticmethod
-    def get_logo_paths() -> list[Path]:
-        return [
+    @lru_cache(maxsize=1)
+    def get_logo_paths() -> tuple[Path, ...]:
+        candidates = (
             Path(__file__).parent.parent.parent / "assets" / "ui" / "logo.png",
             Path.cwd() / "assets" / "ui" / "logo.png",
-        ]
+        )
+        return tuple(path for path in candidates if path.is_file())
 
@@ -1,5 +1,8 @@
+import sys
+from typing import Callable
+
 from loguru import logger
-from PySide6.QtCore import QTimer, Signal
+from PySide6.QtCore import QCoreApplication, QEvent, Qt, QTimer, Signal, Slot
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -23,7 +26,8 @@ from .constants import (
     WindowConstants,
 )
 from .services import PortService, PresetService
-from .services.port_service import PortRefreshThread
+from .services.connection_service import ConnectThread
+from .services.port_service import DeviceChangeFilter, PortRefreshThread
 from .style_manager import style_manager
 from .widgets import (
     ConnectionPanel,
@@ -37,6 +41,10 @@ from .widgets import (
 
 
 class MainWindow(QMainWindow):
+    _ACTIVE_STATUSES = frozenset(
+        {ConnectionStatus.CONNECTED, ConnectionStatus.CONNECTING}
+    )
+
     status_changed = Signal(object)
     response_received = Signal(object)
     event_received = Signal(object)
@@ -47,34 +55,56 @@ class MainWindow(QMainWindow):
         super().__init__()
         self._session_controller = SessionController()
         self._port_refresh_timer = QTimer()
-        self._port_refresh_thread = PortRefreshThread()
+        self._port_refresh_thread = PortRefreshThread(
+            PortService.REFRESH_MAX_AGE_SECONDS
+        )
+        self._connect_thread = ConnectThread(self._session_controller)
+        self._device_change_filter = DeviceChangeFilter(self._on_device_change)
         self._sequence_timer = QTimer()
+        self._sequence_timer.setSingleShot(True)
         self._sequence_step = 0
         self._sequence_running = False
-        self._current_section_intensities: dict[str, int] = {
-            "section1": 0,
-            "section2": 0,
-            "section3": 0,
-            "section4": 0,
-        }
-        self._current_ring_intensities: dict[str, int] = {
-            "ring_1": 0,
-            "ring_2": 0,
-            "ring_3": 0,
-            "ring_4": 0,
-        }
+        self._current_ring_intensities: dict[str, int] = dict.fromkeys(
+            LightingConstants.RING_KEYS, 0
+        )
         self._weight_throttle_timer = QTimer()
         self._weight_throttle_timer.setSingleShot(True)
         self._pending_weight: float | None = None
+        self._section_log_timer = QTimer()
+        self._section_log_timer.setSingleShot(True)
+        self._pending_section_log: tuple[int, int, bool] | None = None
+        self._lighting_send_timer = QTimer()
+        self._lighting_send_timer.setSingleShot(True)
+        self._pending_section_change: tuple[int, int] | None = None
+        self._event_handlers = self._build_event_handlers()
+        self._status_handlers: dict[ConnectionStatus, Callable[[], None]] = {
+            ConnectionStatus.CONNECTED: self._update_ui_connected,
+            ConnectionStatus.CONNECTING: self._update_ui_connecting,
+            ConnectionStatus.ERROR: self._update_ui_error,
+        }
         self._initialize_window()
         logger.info("Main window initialized")
 
+    def _build_event_handlers(self) -> dict[str, Callable[[Message], None]]:
+        return {
+            MessageType.EVENT_STATUS: self._handle_status_event,
+            MessageType.EVENT_SEQUENCE_STARTED: self._handle_sequence_started_event,
+            MessageType.EVENT_SEQUENCE_PROGRESS: self._handle_sequence_progress_event,
+            MessageType.EVENT_SEQUENCE_COMPLETED: self._handle_sequence_completed_event,
+            MessageType.EVENT_SEQUENCE_STOPPED: self._handle_sequence_stopped_event,
+            MessageType.EVENT_ERROR: self._handle_error_event,
+            MessageType.EVENT_CAMERA_TRIGGERED: self._handle_camera_triggered_event,
+            MessageType.EVENT_MOTOR_COMPLETE: self._handle_motor_complete_event,
+            MessageType.EVENT_WEIGHT_READING: self._handle_weight_reading_event,
+        }
+
     def _initialize_window(self) -> None:
         self._setup_window()
         self._setup_ui()
         self._setup_connections()
         self._setup_session_callbacks()
         self._start_port_refresh()
+        self._install_device_change_filter()
         self._apply_styles()
 
     def _setup_window(self) -> None:
@@ -89,12 +119,11 @@ class MainWindow(QMainWindow):
         self._set_window_icon()
 
     def _set_window_icon(self) -> None:
-        for icon_path in IconPaths.get_logo_paths():
-            if icon_path.exists():
-                self.setWindowIcon(QIcon(str(icon_path)))
-                logger.info(f"Application icon loaded from: {icon_path}")
-                return
-        logger.warning("Application icon not found")
+        if not (logo_paths := IconPaths.get_logo_paths()):
+            logger.warning("Application icon not found")
+            return
+        self.setWindowIcon(QIcon(str(logo_paths[0])))
+        logger.info(f"Application icon loaded from: {logo_paths[0]}")
 
     def _setup_ui(self) -> None:
         central_widget = QWidget()
@@ -107,19 +136,17 @@ class MainWindow(QMainWindow):
             LayoutConstants.MARGIN,
         )
         main_layout.setSpacing(LayoutConstants.SPACING)
-        main_layout.addWidget(self._create_header())
+        main_layout.addLayout(self._create_header())
         main_layout.addLayout(self._create_content_layout(), 1)
 
-    def _create_header(self) -> QWidget:
-        header_widget = QWidget()
-        header_layout = QHBoxLayout(header_widget)
-        header_layout.setContentsMargins(0, 0, 0, 0)
+    def _create_header(self) -> QHBoxLayout:
+        header_layout = QHBoxLayout()
         header_layout.setSpacing(LayoutConstants.HEADER_SPACING)
         header_layout.addLayout(self._create_title_section())
         header_layout.addStretch()
         header_layout.addLayout(self._create_status_cards())
         header_layout.addWidget(self._create_connection_panel())
-        return header_widget
+        return header_layout
 
     def _create_title_section(self) -> QVBoxLayout:
         layout = QVBoxLayout()
@@ -178,19 +205,17 @@ class MainWindow(QMainWindow):
         layout.addStretch()
         return panel
 
-    def _create_right_panel(self) -> QWidget:
-        panel = QWidget()
-        layout = QVBoxLayout(panel)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(LayoutConstants.LOG_PANEL_SPACING)
+    def _create_right_panel(self) -> LogPanel:
         self._log_panel = LogPanel()
-        layout.addWidget(self._log_panel)
-        return panel
+        return self._log_panel
 
     def _setup_connections(self) -> None:
-        self._connection_panel.port_refresh_requested.connect(self._refresh_ports)
+        self._connection_panel.port_refresh_requested.connect(
+            self._on_port_refresh_requested
+        )
         self._connection_panel.connection_toggle_requested.connect(self._toggle_connection)
         self._port_refresh_thread.ports_updated.connect(self._update_port_list)
+        self._connect_thread.connection_finished.connect(self._on_connection_finished)
         self._lighting_panel.section_changed.connect(self._on_section_changed)
         self._lighting_panel.backlight_toggled.connect(self._on_backlight_toggled)
         self._preset_panel.preset_selected.connect(self._on_preset_selected)
@@ -202,26 +227,24 @@ class MainWindow(QMainWindow):
         self._photo_panel.stop_sequence_requested.connect(self._on_stop_sequence)
         self._photo_panel.emergency_stop_requested.connect(self._on_emergency_stop)
         self._photo_panel.led_toggle_requested.connect(self._on_toggle_led)
-        self.status_changed.connect(self._on_connection_status_changed)
-        self.response_received.connect(self._on_arduino_response)
-        self.event_received.connect(self._on_esp32_event)
-        self.heartbeat_received.connect(self._on_heartbeat_received)
-        self.weight_update.connect(self._on_weight_update_throttled)
+        queued = Qt.ConnectionType.QueuedConnection
+        self.status_changed.connect(self._on_connection_status_changed, queued)
+        self.response_received.connect(self._on_arduino_response, queued)
+        self.event_received.connect(self._on_esp32_event, queued)
+        self.heartbeat_received.connect(self._on_heartbeat_received, queued)
+        self.weight_update.connect(
+            self._on_weight_update_throttled, Qt.ConnectionType.DirectConnection
+        )
         self._weight_throttle_timer.timeout.connect(self._process_pending_weight)
+        self._section_log_timer.timeout.connect(self._flush_section_log)
+        self._sequence_timer.timeout.connect(self._execute_sequence_step)
+        self._lighting_send_timer.timeout.connect(self._flush_lighting)
 
     def _setup_session_callbacks(self) -> None:
-        self._session_controller.add_status_callback(
-            lambda s: self.status_changed.emit(s)
-        )
-        self._session_controller.add_response_callback(
-            lambda r: self.response_received.emit(r)
-        )
-        self._session_controller.add_event_callback(
-            lambda e: self.event_received.emit(e)
-        )
-        self._session_controller.add_heartbeat_callback(
-            lambda h: self.heartbeat_received.emit(h)
-        )
+        self._session_controller.add_status_callback(self.status_changed.emit)
+        self._session_controller.add_response_callback(self.response_received.emit)
+        self._session_controller.add_event_callback(self.event_received.emit)
+        self._session_controller.add_heartbeat_callback(self.heartbeat_received.emit)
         self._session_controller.add_ack_callback(self._on_acknowledgment_received)
 
     def _start_port_refresh(self) -> None:
@@ -239,18 +262,27 @@ class MainWindow(QMainWindow):
         else:
             logger.warning("No stylesheet available")
 
+    @Slot()
     def _refresh_ports(self) -> None:
         if not self._port_refresh_thread.isRunning():
             self._port_refresh_thread.start()
         else:
             logger.debug("Port refresh skipped - previous refresh still in progress")
 
+    @Slot()
+    def _on_port_refresh_requested(self) -> None:
+        PortService.invalidate_cache()
+        self._refresh_ports()
+
+    @Slot(list)
     def _update_port_list(self, ports: list[str]) -> None:
-        annotated_ports = PortService.annotate_arduino_ports(ports)
-        self._connection_panel.set_ports(annotated_ports)
+        self._connection_panel.set_ports(ports)
 
+    @Slot()
     def _toggle_connection(self) -> None:
-        if self._session_controller.is_connected:
+        if self._connect_thread.isRunning():
+            logger.debug("Connection attempt already in progress")
+        elif self._session_controller.current_status in self._ACTIVE_STATUSES:
             self._session_controller.disconnect()
         else:
             self._connect_to_arduino()
@@ -262,21 +294,19 @@ class MainWindow(QMainWindow):
             return
         port = PortService.clean_port_name(port)
         self._log_panel.add_message(f"Conectando a {port}...")
-        success = self._session_controller.connect(port, settings.default_baud_rate)
+        self._connect_thread.start_connect(port, settings.default_baud_rate)
+
+    @Slot(bool)
+    def _on_connection_finished(self, success: bool) -> None:
         self._log_panel.add_message(
             "Conectado exitosamente" if success else "Error de conexión",
             is_error=not success,
         )
 
+    @Slot(object)
     def _on_connection_status_changed(self, status: ConnectionStatus) -> None:
-        if status == ConnectionStatus.CONNECTED:
-            self._update_ui_connected()
-        elif status == ConnectionStatus.CONNECTING:
-            self._update_ui_connecting()
-        elif status == ConnectionStatus.ERROR:
-            self._update_ui_error()
-        else:
-            self._update_ui_disconnected()
+        PortService.invalidate_cache()
+        self._status_handlers.get(status, self._update_ui_disconnected)()
 
     def _update_ui_connected(self) -> None:
         self._connection_panel.set_connect_button_text("Desconectar")
@@ -286,40 +316,69 @@ class MainWindow(QMainWindow):
         style_manager.apply_button_style(
             self._connection_panel.connect_button, "disconnect"
         )
+        self._update_port_refresh()
 
     def _update_ui_connecting(self) -> None:
         self._connection_card.set_value("Conectando...", "connecting")
         self._heartbeat_card.set_value("—", "inactive")
 
     def _update_ui_error(self) -> None:
+        self._reset_connect_button()
         self._connection_card.set_value("Error", "disconnected")
+        self._photo_panel.set_system_info("Error", "disconnected")
         self._heartbeat_card.set_value("—", "inactive")
+        self._update_port_refresh()
 
     def _update_ui_disconnected(self) -> None:
-        self._connection_panel.set_connect_button_text("Conectar")
+        self._reset_connect_button()
         self._connection_card.set_value("Desconectado", "disconnected")
         self._photo_panel.set_system_info("Desconectado", "disconnected")
         self._heartbeat_card.set_value("—", "inactive")
+        self._update_port_refresh()
+
+    def _reset_connect_button(self) -> None:
+        self._connection_panel.set_connect_button_text("Conectar")
         self._connection_panel.connect_button.setObjectName("")
         style_manager.refresh_widget_style(self._connection_panel.connect_button)
 
+    def _update_port_refresh(self) -> None:
+        if self._session_controller.is_connected or self.isMinimized():
+            self._port_refresh_timer.stop()
+        elif not self._port_refresh_timer.isActive():
+            self._port_refresh_timer.start(settings.port_refresh_interval_ms)
+            self._refresh_ports()
+
+    @Slot(int, int)
     def _on_section_changed(self, section_index: int, intensity: int) -> None:
         self._preset_panel.clear_selection()
         if not self._session_controller.is_connected:
             return
         # Update only the corresponding ring (section_index maps to ring number)
         # Section 0 -> ring_1, Section 1 -> ring_2, etc.
-        ring_channel = f"ring_{section_index + 1}"
+        ring_channel = LightingConstants.RING_KEYS[section_index]
         self._current_ring_intensities[ring_channel] = intensity
+        self._pending_section_change = (section_index, intensity)
+        if not self._lighting_send_timer.isActive():
+            self._flush_lighting()
+
+    @Slot()
+    def _flush_lighting(self) -> None:
+        pending, self._pending_section_change = self._pending_section_change, None
+        if pending is None or not self._session_controller.is_connected:
+            return
+        section_index, intensity = pending
         success = self._send_all_ring_lighting()
         self._log_section_change(section_index, intensity, success)
+        self._lighting_send_timer.start(ThrottleConstants.LIGHTING_SEND_MS)
 
     def _send_all_ring_lighting(self) -> bool:
         """Send all 4 ring lighting values in a single message."""
         try:
             sent = self._session_controller.set_sections_async(self._current_ring_intensities)
             if sent:
-                logger.debug(f"Sent all ring lighting values: {self._current_ring_intensities}")
+                logger.debug(
+                    "Sent all ring lighting values: {}", self._current_ring_intensities
+                )
             else:
                 logger.warning("Failed to send all ring lighting values")
             return sent
@@ -328,23 +387,27 @@ class MainWindow(QMainWindow):
             return False
 
     def _log_section_change(self, section_index: int, intensity: int, success: bool) -> None:
+        self._pending_section_log = (section_index, intensity, success)
+        self._section_log_timer.start(ThrottleConstants.LOG_DELAY_MS)
+
+    @Slot()
+    def _flush_section_log(self) -> None:
+        if self._pending_section_log is None:
+            return
+        section_index, intensity, success = self._pending_section_log
+        self._pending_section_log = None
         if success:
             normalized = intensity / LightingConstants.NORMALIZATION_FACTOR
-            QTimer.singleShot(
-                ThrottleConstants.LOG_DELAY_MS,
-                lambda si=section_index, n=normalized: self._log_panel.add_message(
-                    f"Anillo {si + 1} configurado a {n:.2f}"
-                ),
+            self._log_panel.add_message(
+                f"Anillo {section_index + 1} configurado a {normalized:.2f}"
             )
         else:
-            QTimer.singleShot(
-                ThrottleConstants.LOG_DELAY_MS,
-                lambda si=section_index: self._log_panel.add_message(
-                    f"Error al enviar comando Anillo {si + 1}",
-                    is_error=True,
-                ),
+            self._log_panel.add_message(
+                f"Error al enviar comando Anillo {section_index + 1}",
+                is_error=True,
             )
 
+    @Slot(str, dict)
     def _on_preset_selected(self, preset_name: str, preset_values: dict[str, int]) -> None:
         self._lighting_panel.set_all_values(preset_values)
         ring_intensities = self._calculate_ring_intensities(preset_values)
@@ -357,13 +420,10 @@ class MainWindow(QMainWindow):
         self, preset_values: dict[str, int]
     ) -> dict[str, int]:
         ring_intensities: dict[str, int] = {}
-        for ring_idx in range(1, 5):
-            ring_key = f"ring_{ring_idx}"
-            section_values = []
-            for section_idx in range(1, 5):
-                preset_key = f"ring{ring_idx}_section{section_idx}"
-                if preset_key in preset_values:
-                    section_values.append(preset_values[preset_key])
+        for ring_key, preset_keys in LightingConstants.RING_SECTION_KEYS:
+            section_values = [
+                preset_values[key] for key in preset_keys if key in preset_values
+            ]
             if section_values:
                 avg_intensity = sum(section_values) // len(section_values)
                 ring_intensities[ring_key] = avg_intensity
@@ -386,6 +446,7 @@ class MainWindow(QMainWindow):
                 is_error=True,
             )
 
+    @Slot()
     def _on_position_forward(self) -> None:
         if not self._check_connected():
             return
@@ -396,6 +457,7 @@ class MainWindow(QMainWindow):
             is_error=not success,
         )
 
+    @Slot()
     def _on_position_backward(self) -> None:
         if not self._check_connected():
             return
@@ -406,6 +468,7 @@ class MainWindow(QMainWindow):
             is_error=not success,
         )
 
+    @Slot()
     def _on_flip_coin(self) -> None:
         if not self._check_connected():
             return
@@ -416,6 +479,7 @@ class MainWindow(QMainWindow):
             is_error=not success,
         )
 
+    @Slot()
     def _on_take_photo(self) -> None:
         if not self._check_connected():
             return
@@ -426,6 +490,7 @@ class MainWindow(QMainWindow):
             is_error=not success,
         )
 
+    @Slot()
     def _on_start_sequence(self) -> None:
         if not self._check_connected():
             return
@@ -437,10 +502,9 @@ class MainWindow(QMainWindow):
         self._arduino_card.set_value("En proceso", "progress")
         self._sequence_running = True
         self._sequence_step = 0
-        self._sequence_timer.timeout.connect(self._execute_sequence_step)
-        self._sequence_timer.setSingleShot(True)
         self._execute_sequence_step()
 
+    @Slot()
     def _execute_sequence_step(self) -> None:
         if not self._sequence_running:
             return
@@ -459,7 +523,6 @@ class MainWindow(QMainWindow):
         self._sequence_running = False
         self._photo_panel.set_sequence_active(False)
         self._sequence_step = 0
-        self._disconnect_sequence_timer()
 
     def _execute_first_flip(self) -> None:
         self._log_panel.add_message("Paso 1/4: Volteando moneda (primera vez)...")
@@ -492,21 +555,14 @@ class MainWindow(QMainWindow):
         self._sequence_running = False
         self._photo_panel.set_sequence_active(False)
         self._sequence_step = 0
-        self._disconnect_sequence_timer()
 
     def _handle_sequence_error(self, error_message: str) -> None:
         self._log_panel.add_message(error_message, is_error=True)
         self._sequence_running = False
         self._photo_panel.set_sequence_active(False)
         self._arduino_card.set_value("Error", "disconnected")
-        self._disconnect_sequence_timer()
-
-    def _disconnect_sequence_timer(self) -> None:
-        try:
-            self._sequence_timer.timeout.disconnect()
-        except RuntimeError:
-            pass
 
+    @Slot()
     def _on_stop_sequence(self) -> None:
         if not self._sequence_running:
             return
@@ -514,10 +570,10 @@ class MainWindow(QMainWindow):
         self._sequence_running = False
         self._sequence_step = 0
         self._sequence_timer.stop()
-        self._disconnect_sequence_timer()
         self._photo_panel.set_sequence_active(False)
         self._arduino_card.set_value("Operativo", "operational")
 
+    @Slot()
     def _on_toggle_led(self) -> None:
         if not self._check_connected():
             return
@@ -533,6 +589,7 @@ class MainWindow(QMainWindow):
         else:
             self._log_panel.add_message("Error al alternar LED de prueba", is_error=True)
 
+    @Slot(bool)
     def _on_backlight_toggled(self, enabled: bool) -> None:
         if not self._check_connected():
             return
@@ -544,6 +601,7 @@ class MainWindow(QMainWindow):
         else:
             self._log_panel.add_message(f"Error al {state_text} backlight LED", is_error=True)
 
+    @Slot()
     def _on_emergency_stop(self) -> None:
         if not self._check_connected():
             return
@@ -556,6 +614,7 @@ class MainWindow(QMainWindow):
         else:
             self._log_panel.add_message("Error en paro de emergencia", is_error=True)
 
+    @Slot(object)
     def _on_arduino_response(self, response: Response) -> None:
         if response.data and "led_state" in response.data:
             led_state = response.data["led_state"]
@@ -571,30 +630,16 @@ class MainWindow(QMainWindow):
             self._log_panel.add_message(f"Error ESP32: {message}", is_error=True)
             self._arduino_card.set_value("Error", "disconnected")
 
+    @Slot(object)
     def _on_esp32_event(self, event: Message) -> None:
-        logger.info(f"ESP32 Event: {event.type}")
-        if event.type == MessageType.EVENT_STATUS:
-            self._handle_status_event(event)
-        elif event.type == MessageType.EVENT_SEQUENCE_STARTED:
-            self._handle_sequence_started_event(event)
-        elif event.type == MessageType.EVENT_SEQUENCE_PROGRESS:
-            self._handle_sequence_progress_event(event)
-        elif event.type == MessageType.EVENT_SEQUENCE_COMPLETED:
-            self._handle_sequence_completed_event(event)
-        elif event.type == MessageType.EVENT_SEQUENCE_STOPPED:
-            self._handle_sequence_stopped_event(event)
-        elif event.type == MessageType.EVENT_ERROR:
-            self._handle_error_event(event)
-        elif event.type == MessageType.EVENT_CAMERA_TRIGGERED:
-            self._handle_camera_triggered_event(event)
-        elif event.type == MessageType.EVENT_MOTOR_COMPLETE:
-            self._handle_motor_complete_event(event)
-        elif event.type == MessageType.EVENT_WEIGHT_READING:
-            self._handle_weight_reading_event(event)
+        logger.debug("ESP32 Event: {}", event.type)
+        if handler := self._event_handlers.get(event.type):
+            handler(event)
 
     def _handle_status_event(self, event: Message) -> None:
-        message = event.payload.get("message", "Ready")
-        firmware_version = event.payload.get("firmware_version", "Unknown")
+        payload = event.payload
+        message = payload.get("message", "Ready")
+        firmware_version = payload.get("firmware_version", "Unknown")
         self._log_panel.add_message(f"{message} (Firmware: v{firmware_version})")
         self._arduino_card.set_value(f"{message}", "Ready")
 
@@ -604,30 +649,34 @@ class MainWindow(QMainWindow):
         self._photo_panel.set_sequence_active(True)
 
     def _handle_sequence_progress_event(self, event: Message) -> None:
-        current = event.payload.get("current_photo", 0)
-        total = event.payload.get("total_photos", 0)
-        action = event.payload.get("action", "")
+        payload = event.payload
+        current = payload.get("current_photo", 0)
+        total = payload.get("total_photos", 0)
+        action = payload.get("action", "")
         self._log_panel.add_message(f"Progreso: {current}/{total} - {action}")
 
     def _handle_sequence_completed_event(self, event: Message) -> None:
-        photos = event.payload.get("photos_taken", 0)
-        duration = event.payload.get("duration", 0)
+        payload = event.payload
+        photos = payload.get("photos_taken", 0)
+        duration = payload.get("duration", 0)
         self._log_panel.add_message(
             f"Secuencia completada: {photos} fotos en {duration:.1f}s"
         )
         self._photo_panel.set_sequence_active(False)
 
     def _handle_sequence_stopped_event(self, event: Message) -> None:
-        reason = event.payload.get("reason", "unknown")
-        photos = event.payload.get("photos_taken", 0)
+        payload = event.payload
+        reason = payload.get("reason", "unknown")
+        photos = payload.get("photos_taken", 0)
         self._log_panel.add_message(
             f"Secuencia detenida ({reason}): {photos} fotos", is_error=True
         )
         self._photo_panel.set_sequence_active(False)
 
     def _handle_error_event(self, event: Message) -> None:
-        msg = event.payload.get("message", "Error desconocido")
-        severity = event.payload.get("severity", "medium")
+        payload = event.payload
+        msg = payload.get("message", "Error desconocido")
+        severity = payload.get("severity", "medium")
         self._log_panel.add_message(f"Error [{severity}]: {msg}", is_error=True)
 
     def _handle_camera_triggered_event(self, event: Message) -> None:
@@ -642,18 +691,16 @@ class MainWindow(QMainWindow):
         weight = event.payload.get("weight", 0.0)
         self.weight_update.emit(weight)
 
+    @Slot(object)
     def _on_heartbeat_received(self, health: ConnectionHealth) -> None:
         if health.is_alive:
             self._heartbeat_card.set_value("Active", "connected")
             if health.heartbeat_count % 10 == 0:
-                uptime_seconds = health.esp32_uptime_ms / 1000
-                if uptime_seconds < 60:
-                    uptime_str = f"{uptime_seconds:.0f}s"
-                elif uptime_seconds < 3600:
-                    uptime_str = f"{uptime_seconds / 60:.1f}m"
-                else:
-                    uptime_str = f"{uptime_seconds / 3600:.1f}h"
-                logger.debug(f"Heartbeat #{health.heartbeat_count}: uptime={uptime_str}")
+                logger.opt(lazy=True).debug(
+                    "Heartbeat #{}: uptime={}",
+                    lambda: health.heartbeat_count,
+                    lambda: self._format_uptime(health.esp32_uptime_ms),
+                )
         else:
             self._heartbeat_card.set_value("dead", "disconnected")
             self._log_panel.add_message(
@@ -661,17 +708,30 @@ class MainWindow(QMainWindow):
             )
             logger.warning("Heartbeat timeout - connection lost")
 
+    @staticmethod
+    def _format_uptime(uptime_ms: int) -> str:
+        uptime_seconds = uptime_ms / 1000
+        if uptime_seconds < 60:
+            return f"{uptime_seconds:.0f}s"
+        if uptime_seconds < 3600:
+            return f"{uptime_seconds / 60:.1f}m"
+        return f"{uptime_seconds / 3600:.1f}h"
+
     def _on_acknowledgment_received(self, ack: AcknowledgmentInfo) -> None:
         logger.debug(
-            f"✓ Command '{ack.received_type}' acknowledged (RTT: {ack.round_trip_ms:.1f}ms)"
+            "✓ Command '{}' acknowledged (RTT: {:.1f}ms)",
+            ack.received_type,
+            ack.round_trip_ms,
         )
 
+    @Slot(float)
     def _on_weight_update_throttled(self, weight: float) -> None:
         self._pending_weight = weight
         if not self._weight_throttle_timer.isActive():
             self._process_pending_weight()
             self._weight_throttle_timer.start(ThrottleConstants.WEIGHT_UPDATE_MS)
 
+    @Slot()
     def _process_pending_weight(self) -> None:
         if self._pending_weight is not None:
             self._weight_display.set_weight(self._pending_weight)
@@ -683,10 +743,29 @@ class MainWindow(QMainWindow):
             return False
         return True
 
+    def _install_device_change_filter(self) -> None:
+        app = QCoreApplication.instance()
+        if sys.platform == "win32" and app is not None:
+            app.installNativeEventFilter(self._device_change_filter)
+
+    def _remove_device_change_filter(self) -> None:
+        app = QCoreApplication.instance()
+        if sys.platform == "win32" and app is not None:
+            app.removeNativeEventFilter(self._device_change_filter)
+
+    def _on_device_change(self) -> None:
+        PortService.invalidate_cache()
+        self._refresh_ports()
+
+    def changeEvent(self, event: QEvent) -> None:
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._update_port_refresh()
+        super().changeEvent(event)
+
     def closeEvent(self, event) -> None:
-        if self._sequence_running:
-            self._sequence_timer.stop()
-            self._disconnect_sequence_timer()
+        self._remove_device_change_filter()
+        self._sequence_timer.stop()
+        self._connect_thread.wait()
         if self._session_controller.is_connected:
             self._session_controller.disconnect()
         self._port_refresh_timer.stop()
@@ -0,0 +1,27 @@
+from loguru import logger
+from PySide6.QtCore import QThread, Signal
+
+from ...controllers.session_controller import SessionController
+
+
+class ConnectThread(QThread):
+    connection_finished = Signal(bool)
+
+    def __init__(self, session_controller: SessionController) -> None:
+        super().__init__()
+        self._session_controller = session_controller
+        self._port = ""
+        self._baud_rate: int | None = None
+
+    def start_connect(self, port: str, baud_rate: int | None = None) -> None:
+        self._port = port
+        self._baud_rate = baud_rate
+        self.start()
+
+    def run(self) -> None:
+        try:
+            success = self._session_controller.connect(self._port, self._baud_rate)
+        except Exception as e:
+            logger.error(f"Error connecting to {self._port}: {e}")
+            success = False
+        self.connection_finished.emit(success)
@@ -1,30 +1,82 @@
-from PySide6.QtCore import QThread, Signal
+import sys
+from collections.abc import Callable
+from ctypes import wintypes
 
-from ...serialio.ports import get_available_ports, get_arduino_ports
+from PySide6.QtCore import QAbstractNativeEventFilter, QByteArray, QThread, Signal
+
+from ...serialio.ports import (
+    PORT_CACHE_TTL_SECONDS,
+    get_arduino_ports,
+    get_available_ports,
+    invalidate_port_cache,
+)
 
 
 class PortRefreshThread(QThread):
     ports_updated = Signal(list)
 
+    def __init__(self, max_age: float = 0.0) -> None:
+        super().__init__()
+        self._max_age = max_age
+
     def run(self) -> None:
         try:
-            ports = get_available_ports()
-            self.ports_updated.emit(ports)
+            ports = get_available_ports(self._max_age)
+            self.ports_updated.emit(PortService.annotate_arduino_ports(ports))
         except Exception:
             self.ports_updated.emit([])
 
 
+class DeviceChangeFilter(QAbstractNativeEventFilter):
+    def __init__(self, on_device_change: Callable[[], None]) -> None:
+        super().__init__()
+        self._on_device_change = on_device_change
+
+    def nativeEventFilter(
+        self, event_type: QByteArray | bytes | bytearray | memoryview, message: int
+    ) -> tuple[bool, int]:
+        if PortService.is_device_change(event_type, message):
+            self._on_device_change()
+        return False, 0
+
+
 class PortService:
     ARDUINO_ANNOTATION = " (Arduino)"
+    NATIVE_EVENT_TYPE = b"windows_generic_MSG"
+    WM_DEVICECHANGE = 0x0219
+    DEVICE_CHANGE_EVENTS = frozenset({0x8000, 0x8004})
+    MSG_MESSAGE_OFFSET = wintypes.MSG.message.offset
+    MSG_WPARAM_OFFSET = wintypes.MSG.wParam.offset
+    HOTPLUG_CACHE_TTL_SECONDS = 60.0
+    REFRESH_MAX_AGE_SECONDS = (
+        HOTPLUG_CACHE_TTL_SECONDS if sys.platform == "win32" else 0.0
+    )
 
     @classmethod
     def annotate_arduino_ports(cls, ports: list[str]) -> list[str]:
-        arduino_ports = get_arduino_ports()
+        arduino_ports = frozenset(get_arduino_ports(max_age=PORT_CACHE_TTL_SECONDS))
         return [
             f"{port}{cls.ARDUINO_ANNOTATION}" if port in arduino_ports else port
             for port in ports
         ]
 
+    @staticmethod
+    def invalidate_cache() -> None:
+        invalidate_port_cache()
+
+    @classmethod
+    def is_device_change(
+        cls, event_type: QByteArray | bytes | bytearray | memoryview, message: int
+    ) -> bool:
+        if event_type != cls.NATIVE_EVENT_TYPE:
+            return False
+        address = int(message)
+        msg_id = wintypes.UINT.from_address(address + cls.MSG_MESSAGE_OFFSET)
+        if msg_id.value != cls.WM_DEVICECHANGE:
+            return False
+        w_param = wintypes.WPARAM.from_address(address + cls.MSG_WPARAM_OFFSET)
+        return w_param.value in cls.DEVICE_CHANGE_EVENTS
+
     @classmethod
     def clean_port_name(cls, port: str) -> str:
         return port.replace(cls.ARDUINO_ANNOTATION, "")
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import (
     QFileDialog,
     QGroupBox,
@@ -26,6 +27,11 @@ class LogPanel(QGroupBox):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__("Registro", parent)
+        self._pending_entries: list[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_pending)
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -61,10 +67,22 @@ class LogPanel(QGroupBox):
             f'<span style="color: {color}; font-weight: 500;">{level}:</span> '
             f'<span style="color: {color};">{message}</span>'
         )
-        self._log_text.append(log_entry)
+        self._pending_entries.append(log_entry)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self) -> None:
+        if not self._pending_entries:
+            return
+        entries, self._pending_entries = self._pending_entries, []
+        self._log_text.setUpdatesEnabled(False)
+        for log_entry in entries:
+            self._log_text.append(log_entry)
+        self._log_text.setUpdatesEnabled(True)
         self._scroll_to_bottom()
 
     def clear(self) -> None:
+        self._pending_entries.clear()
         self._log_text.clear()
         self.add_message("Registro limpiado")
 
@@ -77,6 +95,7 @@ class LogPanel(QGroupBox):
             "Archivos de texto (*.txt);;Todos los archivos (*.*)",
         )
         if filename:
+            self._flush_pending()
             try:
                 with open(filename, "w", encoding="utf-8") as f:
                     f.write("Registro de Actividad - CARAC UCA\n")
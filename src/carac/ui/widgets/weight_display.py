@@ -10,6 +10,7 @@ class WeightDisplayWidget(QGroupBox):
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__("Medida Peso", parent)
+        self._displayed_text = ""
         self._setup_ui()
         self._set_weight(self._INITIAL_WEIGHT)
 
@@ -32,7 +33,10 @@ class WeightDisplayWidget(QGroupBox):
         layout.addWidget(unit_label)
 
     def _set_weight(self, weight: float) -> None:
-        self._weight_label.setText(self._WEIGHT_FORMAT.format(weight))
+        text = self._WEIGHT_FORMAT.format(weight)
+        if text != self._displayed_text:
+            self._displayed_text = text
+            self._weight_label.setText(text)
 
     def set_weight(self, weight: float) -> None:
         self._set_weight(weight)
@@ -1,354 +1,361 @@
 """Tests for Arduino client functionality."""
 
-import pytest
-import time
-from unittest.mock import Mock, patch, MagicMock
+import json
+from threading import Thread
+from unittest.mock import Mock, patch
+
+import serial
 
-from carac.serialio.arduino_client import ArduinoClient
 from carac.protocol.models import (
-    Command,
-    Response,
     ConnectionStatus,
-    PingCommand,
-    StatusCommand,
-    LightingCommand,
-    PhotoSequenceCommand,
+    LightingSetCommand,
+    Response,
+    SystemPingCommand,
 )
+from carac.serialio.arduino_client import ArduinoClient, _PendingResponse
+
+
+def _reply(seq=None, message="ok", success=True):
+    frame = {
+        "type": "response_success" if success else "response_error",
+        "payload": {"message": message},
+    }
+    if seq is not None:
+        frame["seq"] = seq
+    return json.dumps(frame).encode() + b"\n"
+
+
+def _connected_client(reply):
+    client = ArduinoClient()
+    client._command_timeout = 0.1
+    client._serial = Mock(is_open=True)
+
+    def write(data):
+        sent = [json.loads(line) for line in data.splitlines()]
+        for frame in reply(sent):
+            client._handle_frame(frame)
+
+    client._serial.write.side_effect = write
+    return client
 
 
 class TestArduinoClient:
     """Test ArduinoClient class."""
-    
+
     def test_initialization(self):
         """Test client initialization."""
         client = ArduinoClient()
-        
-        assert client.serial is None
+
         assert client.status == ConnectionStatus.DISCONNECTED
-        assert client._read_thread is None
-        assert client._stop_reading is False
-        assert client._response_callback is None
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_connect_success(self, mock_serial_class):
-        """Test successful connection."""
-        # Mock serial connection
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial_class.return_value = mock_serial
-        
-        client = ArduinoClient()
-        
-        # Mock ping response
-        mock_serial.readline.return_value = b'{"success": true, "message": "pong"}\n'
-        
-        success = client.connect("COM3", 9600)
-        
-        assert success is True
-        assert client.status == ConnectionStatus.CONNECTED
-        assert client.serial is not None
-        mock_serial_class.assert_called_once_with(
-            port="COM3",
-            baudrate=9600,
-            timeout=1.0,
-            write_timeout=1.0,
-        )
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
+        assert client.is_connected is False
+        assert client._pending == {}
+
+    @patch("carac.serialio.arduino_client.serial.Serial")
     def test_connect_failure(self, mock_serial_class):
         """Test connection failure."""
         mock_serial_class.side_effect = Exception("Connection failed")
-        
+
         client = ArduinoClient()
-        success = client.connect("COM3", 9600)
-        
-        assert success is False
+
+        assert client.connect("COM3", 9600) is False
         assert client.status == ConnectionStatus.ERROR
-        assert client.serial is None
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_connect_already_connected(self, mock_serial_class):
-        """Test connection when already connected."""
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial_class.return_value = mock_serial
-        
+
+    def test_send_command_not_connected(self):
+        """Test sending a command without a connection."""
         client = ArduinoClient()
-        client.status = ConnectionStatus.CONNECTED
-        client.serial = mock_serial
-        
-        success = client.connect("COM3", 9600)
-        
-        assert success is True  # Should return True for already connected
-    
-    def test_disconnect(self):
-        """Test disconnection."""
+
+        assert client.send_command(SystemPingCommand.shared()) is None
+        assert client.send_command_async(SystemPingCommand.shared()) is False
+
+    def test_send_batch_empty(self):
+        """Test an empty batch sends nothing."""
+        assert ArduinoClient().send_batch([]) == []
+
+
+class TestResponseRouting:
+    """Test matching responses to pending commands."""
+
+    def test_send_command_matched_by_seq(self):
+        """Test a reply carrying the command seq completes the command."""
+        client = _connected_client(lambda sent: [_reply(sent[0]["seq"], "pong")])
+
+        response = client.send_command(SystemPingCommand.shared())
+
+        assert response == Response(success=True, message="pong", data={})
+        assert client._pending == {}
+
+    def test_send_batch_matched_by_seq_out_of_order(self):
+        """Test batch replies are matched by seq regardless of arrival order."""
+        client = _connected_client(
+            lambda sent: [_reply(frame["seq"], frame["type"]) for frame in sent[::-1]]
+        )
+
+        responses = client.send_batch(
+            [SystemPingCommand.shared(), LightingSetCommand.create("ring_1", 10)]
+        )
+
+        assert [response.message for response in responses] == [
+            "system_ping",
+            "lighting_set",
+        ]
+
+    def test_send_command_fifo_fallback(self):
+        """Test a reply without seq completes the oldest pending command."""
+        client = _connected_client(lambda sent: [_reply(message="legacy")])
+
+        response = client.send_command(SystemPingCommand.shared())
+
+        assert response.message == "legacy"
+
+    def test_route_response_by_seq(self):
+        """Test a seq reply skips older pending commands."""
         client = ArduinoClient()
-        
-        # Mock connected state
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        client.serial = mock_serial
-        client.status = ConnectionStatus.CONNECTED
-        
-        client.disconnect()
-        
-        assert client.status == ConnectionStatus.DISCONNECTED
-        assert client.serial is None
-        mock_serial.close.assert_called_once()
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_send_command_success(self, mock_serial_class):
-        """Test successful command sending."""
-        # Setup mock serial
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial_class.return_value = mock_serial
-        
+        first, second = _PendingResponse(), _PendingResponse()
+        client._pending.update({1: first, 2: second})
+
+        client._handle_frame(_reply(2, "second"))
+
+        assert second.done and second.response.message == "second"
+        assert not first.done
+        assert list(client._pending) == [1]
+
+    def test_route_response_fifo(self):
+        """Test a reply without seq goes to the oldest pending command."""
         client = ArduinoClient()
-        client.serial = mock_serial
-        client.status = ConnectionStatus.CONNECTED
-        
-        # Mock response
-        mock_serial.readline.return_value = b'{"success": true, "message": "OK"}\n'
-        
-        command = PingCommand()
-        response = client.send_command(command)
-        
-        assert response is not None
-        assert response.success is True
-        assert response.message == "OK"
-        
-        # Verify command was written
-        mock_serial.write.assert_called_once()
-        mock_serial.flush.assert_called_once()
-    
-    def test_send_command_not_connected(self):
-        """Test sending command when not connected."""
+        first, second = _PendingResponse(), _PendingResponse()
+        client._pending.update({1: first, 2: second})
+
+        client._handle_frame(_reply(message="first"))
+
+        assert first.done and first.response.message == "first"
+        assert not second.done
+        assert list(client._pending) == [2]
+
+    def test_unmatched_response_goes_to_callback(self):
+        """Test late replies are delivered to the response callback."""
         client = ArduinoClient()
-        
-        command = PingCommand()
-        response = client.send_command(command)
-        
-        assert response is None
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_send_command_no_response(self, mock_serial_class):
-        """Test sending command with no response."""
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial.readline.return_value = b''  # Empty response
-        
+        callback = Mock()
+        client.set_response_callback(callback)
+
+        client._handle_frame(_reply(9, "late", success=False))
+
+        callback.assert_called_once_with(
+            Response(success=False, message="late", data={})
+        )
+
+    def test_timeout_clears_pending(self):
+        """Test unanswered commands time out and leave nothing pending."""
+        client = _connected_client(lambda sent: [])
+
+        assert client.send_command(SystemPingCommand.shared()) is None
+        assert client._pending == {}
+
+
+class TestReconnect:
+    """Test recovery after the serial port fails."""
+
+    def _failing_client(self):
         client = ArduinoClient()
-        client.serial = mock_serial
-        client.status = ConnectionStatus.CONNECTED
-        
-        command = PingCommand()
-        response = client.send_command(command)
-        
-        assert response is None
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_ping_success(self, mock_serial_class):
-        """Test successful ping."""
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial.readline.return_value = b'{"success": true, "message": "pong"}\n'
-        
+        client._port = "COM3"
+        client._baud_rate = 115200
+        client.MAX_RECONNECT_ATTEMPTS = 3
+        client.RECONNECT_JITTER = 0.0
+        client._stop_event = Mock(**{"wait.return_value": False})
+        client._stop_event.is_set.return_value = False
+        failed_port = Mock(is_open=True)
+        failed_port.fileno.side_effect = OSError("not selectable")
+        failed_port.in_waiting = 0
+        failed_port.read.side_effect = serial.SerialException("device unplugged")
+        client._serial = failed_port
+        statuses = []
+        client.set_status_callback(statuses.append)
+        return client, failed_port, statuses
+
+    def test_read_failure_requests_reconnect(self):
+        """Test a SerialException in the read loop asks for a reconnect."""
+        client, failed_port, _ = self._failing_client()
+
+        assert client._read_port(failed_port) is True
+
+    @patch.object(ArduinoClient, "_open_port")
+    def test_reconnect_gives_up_after_budget(self, mock_open_port):
+        """Test the status moves to ERROR once reconnect attempts run out."""
+        mock_open_port.side_effect = serial.SerialException("port not found")
+        client, failed_port, statuses = self._failing_client()
+
+        client._read_loop()
+
+        assert statuses == [ConnectionStatus.CONNECTING, ConnectionStatus.ERROR]
+        assert client.status == ConnectionStatus.ERROR
+        assert mock_open_port.call_count == 3
+        failed_port.close.assert_called_once()
+        delays = [call.args[0] for call in client._stop_event.wait.call_args_list]
+        assert delays == [0.1, 0.2, 0.4]
+        assert client._rx_frames.get_nowait() is None
+
+    @patch.object(ArduinoClient, "_open_port")
+    def test_reconnect_success(self, mock_open_port):
+        """Test a reopened port restores the CONNECTED status."""
+        new_port = Mock(is_open=True)
+        mock_open_port.side_effect = [serial.SerialException("busy"), new_port]
+        client, failed_port, statuses = self._failing_client()
+
+        assert client._reopen_port(failed_port) is new_port
+
+        assert statuses == [ConnectionStatus.CONNECTING, ConnectionStatus.CONNECTED]
+        assert client._serial is new_port
+        assert client.is_connected is True
+
+    @patch.object(ArduinoClient, "_open_port")
+    def test_reconnect_stops_on_disconnect(self, mock_open_port):
+        """Test a stop request ends the reconnect loop without an error status."""
+        client, failed_port, statuses = self._failing_client()
+        client._stop_event.wait.return_value = True
+
+        assert client._reopen_port(failed_port) is None
+
+        assert statuses == [ConnectionStatus.CONNECTING]
+        mock_open_port.assert_not_called()
+
+
+class TestFrameQueue:
+    """Test backpressure on the parse queue."""
+
+    HEARTBEAT = b'{"type": "event_heartbeat", "payload": {"uptime": 1}}'
+
+    def _fill(self, client, count):
+        for index in range(count):
+            client._enqueue_frame(_reply(index).strip())
+
+    def test_heartbeat_dropped_when_backlogged(self):
+        """Test heartbeats are dropped once MAX_QUEUED_FRAMES are waiting."""
         client = ArduinoClient()
-        client.serial = mock_serial
-        client.status = ConnectionStatus.CONNECTED
-        
-        result = client.ping()
-        
-        assert result is True
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_ping_failure(self, mock_serial_class):
-        """Test failed ping."""
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial.readline.return_value = b'{"success": false, "message": "error"}\n'
-        
+        self._fill(client, ArduinoClient.MAX_QUEUED_FRAMES)
+
+        client._enqueue_frame(self.HEARTBEAT)
+        client._enqueue_frame(_reply(999).strip())
+
+        assert client._rx_frames.qsize() == ArduinoClient.MAX_QUEUED_FRAMES + 1
+
+    def test_heartbeat_queued_below_limit(self):
+        """Test heartbeats are queued while the backlog is small."""
         client = ArduinoClient()
-        client.serial = mock_serial
-        client.status = ConnectionStatus.CONNECTED
-        
-        result = client.ping()
-        
-        assert result is False
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_get_status(self, mock_serial_class):
-        """Test getting status."""
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial.readline.return_value = b'{"success": true, "message": "status", "data": {"temp": 25}}\n'
-        
+        self._fill(client, ArduinoClient.MAX_QUEUED_FRAMES - 1)
+
+        client._enqueue_frame(self.HEARTBEAT)
+
+        assert client._rx_frames.qsize() == ArduinoClient.MAX_QUEUED_FRAMES
+
+    def test_oldest_frame_dropped_at_limit(self):
+        """Test the oldest frame is dropped once FRAME_QUEUE_LIMIT is reached."""
         client = ArduinoClient()
-        client.serial = mock_serial
-        client.status = ConnectionStatus.CONNECTED
-        
-        response = client.get_status()
-        
-        assert response is not None
-        assert response.success is True
-        assert response.message == "status"
-        assert response.data["temp"] == 25
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_set_lighting(self, mock_serial_class):
-        """Test setting lighting."""
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial.readline.return_value = b'{"success": true, "message": "lighting set"}\n'
-        
+        self._fill(client, ArduinoClient.FRAME_QUEUE_LIMIT)
+
+        client._enqueue_frame(_reply(999).strip())
+
+        assert client._rx_frames.qsize() == ArduinoClient.FRAME_QUEUE_LIMIT
+        assert json.loads(client._rx_frames.get_nowait())["seq"] == 1
+
+    def test_frames_kept_while_commands_pending(self):
+        """Test no response is dropped while a command awaits its reply."""
         client = ArduinoClient()
-        client.serial = mock_serial
-        client.status = ConnectionStatus.CONNECTED
-        
-        response = client.set_lighting("axial", 128)
-        
-        assert response is not None
-        assert response.success is True
-        assert response.message == "lighting set"
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_start_photo_sequence(self, mock_serial_class):
-        """Test starting photo sequence."""
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial.readline.return_value = b'{"success": true, "message": "photo sequence started"}\n'
-        
+        client._pending[1] = _PendingResponse()
+        self._fill(client, ArduinoClient.FRAME_QUEUE_LIMIT)
+
+        client._enqueue_frame(_reply(999).strip())
+
+        assert client._rx_frames.qsize() == ArduinoClient.FRAME_QUEUE_LIMIT + 1
+        assert json.loads(client._rx_frames.get_nowait())["seq"] == 0
+
+
+class TestFraming:
+    """Test splitting serial input into frames."""
+
+    def _drain(self, client):
+        frames = []
+        while not client._rx_frames.empty():
+            frames.append(client._rx_frames.get_nowait())
+        return frames
+
+    def test_several_frames_in_one_read(self):
+        """Test one read holding several frames yields each of them."""
         client = ArduinoClient()
-        client.serial = mock_serial
-        client.status = ConnectionStatus.CONNECTED
-        
-        response = client.start_photo_sequence(5, 1.0)
-        
-        assert response is not None
-        assert response.success is True
-        assert response.message == "photo sequence started"
-    
-    def test_set_response_callback(self):
-        """Test setting response callback."""
+
+        client._consume_serial_data(_reply(1) + _reply(2) + _reply(3))
+
+        assert self._drain(client) == [_reply(seq).strip() for seq in (1, 2, 3)]
+        assert client._rx_buffer == bytearray()
+
+    def test_partial_frame_across_reads(self):
+        """Test a frame split over several reads is joined."""
         client = ArduinoClient()
-        
-        def callback(response):
-            pass
-        
-        client.set_response_callback(callback)
-        
-        assert client._response_callback == callback
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_is_connected_property(self, mock_serial_class):
-        """Test is_connected property."""
+        frame = _reply(1)
+
+        client._consume_serial_data(frame[:5])
+        client._consume_serial_data(frame[5:20])
+        assert self._drain(client) == []
+
+        client._consume_serial_data(frame[20:] + _reply(2)[:10])
+
+        assert self._drain(client) == [frame.strip()]
+        assert client._rx_buffer == bytearray(_reply(2)[:10])
+
+    def test_garbage_between_frames(self):
+        """Test non-JSON lines and blank lines are skipped."""
         client = ArduinoClient()
-        
-        # Not connected
-        assert client.is_connected is False
-        
-        # Connected
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        client.serial = mock_serial
-        client.status = ConnectionStatus.CONNECTED
-        
-        assert client.is_connected is True
-        
-        # Serial closed
-        mock_serial.is_open = False
-        assert client.is_connected is False
-    
-    def test_context_manager(self):
-        """Test context manager functionality."""
-        with ArduinoClient() as client:
-            assert isinstance(client, ArduinoClient)
-            assert client.status == ConnectionStatus.DISCONNECTED
-
-
-class TestArduinoClientThreading:
-    """Test ArduinoClient threading functionality."""
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_read_thread_start(self, mock_serial_class):
-        """Test read thread starts on connection."""
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial_class.return_value = mock_serial
-        
+
+        client._consume_serial_data(
+            b"boot: ets Jun  8 2016\r\n" + _reply(1) + b"\r\n\n" + _reply(2)
+        )
+
+        assert self._drain(client) == [_reply(1).strip(), _reply(2).strip()]
+
+    def test_crlf_is_stripped(self):
+        """Test CRLF-terminated frames are queued without the CR."""
         client = ArduinoClient()
-        
-        # Mock ping response
-        mock_serial.readline.return_value = b'{"success": true, "message": "pong"}\n'
-        
-        client.connect("COM3", 9600)
-        
-        # Thread should be started
-        assert client._read_thread is not None
-        assert client._read_thread.is_alive()
-        
-        # Clean up
-        client.disconnect()
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_read_thread_stop(self, mock_serial_class):
-        """Test read thread stops on disconnect."""
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial_class.return_value = mock_serial
-        
+
+        client._consume_serial_data(_reply(1).strip() + b"\r\n")
+
+        assert self._drain(client) == [_reply(1).strip()]
+
+    def test_oversized_partial_frame_discarded(self):
+        """Test unterminated input past RX_BUFFER_LIMIT is discarded."""
         client = ArduinoClient()
-        
-        # Mock ping response
-        mock_serial.readline.return_value = b'{"success": true, "message": "pong"}\n'
-        
-        client.connect("COM3", 9600)
-        
-        # Verify thread is running
-        assert client._read_thread.is_alive()
-        
-        # Disconnect should stop thread
-        client.disconnect()
-        
-        # Thread should be stopped
-        assert not client._read_thread.is_alive()
-    
-    @patch('carac.serialio.arduino_client.serial.Serial')
-    def test_async_response_callback(self, mock_serial_class):
-        """Test async response callback."""
-        mock_serial = Mock()
-        mock_serial.is_open = True
-        mock_serial.in_waiting = 10  # Simulate data available
-        mock_serial.readline.return_value = b'{"success": true, "message": "async"}\n'
-        mock_serial_class.return_value = mock_serial
-        
+
+        client._consume_serial_data(b"{" + b"x" * ArduinoClient.RX_BUFFER_LIMIT)
+        client._consume_serial_data(b"\n" + _reply(1))
+
+        assert self._drain(client) == [_reply(1).strip()]
+
+
+class TestParseThread:
+    """Test the parse thread and its shutdown sentinel."""
+
+    def test_parse_loop_handles_frames_until_sentinel(self):
+        """Test queued frames are handled in order and None stops the loop."""
         client = ArduinoClient()
-        
-        # Set up callback
-        callback_called = False
-        callback_response = None
-        
-        def callback(response):
-            nonlocal callback_called, callback_response
-            callback_called = True
-            callback_response = response
-        
+        callback = Mock()
         client.set_response_callback(callback)
-        
-        # Mock ping response for connection
-        mock_serial.readline.return_value = b'{"success": true, "message": "pong"}\n'
-        
-        client.connect("COM3", 9600)
-        
-        # Wait a bit for async processing
-        time.sleep(0.1)
-        
-        # Disconnect to stop thread
+        thread = Thread(target=client._parse_loop, daemon=True)
+        thread.start()
+
+        client._consume_serial_data(_reply(1, "first") + _reply(2, "second"))
+        client._rx_frames.put(None)
+        thread.join(timeout=1.0)
+
+        assert not thread.is_alive()
+        assert [call.args[0].message for call in callback.call_args_list] == [
+            "first",
+            "second",
+        ]
+
+    def test_disconnect_stops_parse_thread(self):
+        """Test disconnect wakes the blocked parse thread with the sentinel."""
+        client = ArduinoClient()
+        client._parse_thread = Thread(target=client._parse_loop, daemon=True)
+        client._parse_thread.start()
+
         client.disconnect()
-        
-        # Callback should have been called
-        assert callback_called
-        assert callback_response is not None
-        assert callback_response.message == "async"
+
+        assert not client._parse_thread.is_alive()
+        assert client.status == ConnectionStatus.DISCONNECTED
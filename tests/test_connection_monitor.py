@@ -0,0 +1,70 @@
+"""Tests for heartbeat connection monitoring."""
+
+import time
+from threading import Event
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from carac.serialio.connection_monitor import ConnectionMonitor
+
+HEARTBEAT_TIMEOUT = 0.05
+WAIT_LIMIT = 2.0
+
+
+@pytest.fixture
+def monitor():
+    """Monitor with a short heartbeat timeout, stopped after the test."""
+    with patch.object(
+        ConnectionMonitor,
+        "heartbeat_timeout_seconds",
+        new_callable=PropertyMock,
+        return_value=HEARTBEAT_TIMEOUT,
+    ):
+        monitor = ConnectionMonitor()
+        yield monitor
+        monitor.stop_monitoring()
+
+
+class TestHeartbeatTimeout:
+    """Test the deadline-based heartbeat timeout wait."""
+
+    def test_first_heartbeat_wakes_waiter(self, monitor):
+        """Test the first heartbeat arms the deadline of an idle monitor."""
+        timed_out = Event()
+        monitor.set_timeout_callback(timed_out.set)
+        monitor.start_monitoring()
+        time.sleep(HEARTBEAT_TIMEOUT * 2)
+
+        assert not timed_out.is_set()
+
+        monitor.handle_heartbeat(1000, "ok")
+
+        assert timed_out.wait(WAIT_LIMIT)
+
+    def test_timeout_fires_after_heartbeat_timeout(self, monitor):
+        """Test the timeout fires once no heartbeat arrives in time."""
+        timed_out = Event()
+        health_updates = []
+        monitor.set_timeout_callback(timed_out.set)
+        monitor.set_heartbeat_callback(health_updates.append)
+        monitor.start_monitoring()
+
+        last_heartbeat = time.monotonic()
+        monitor.handle_heartbeat(1000, "ok")
+
+        assert timed_out.wait(WAIT_LIMIT)
+        assert time.monotonic() - last_heartbeat >= HEARTBEAT_TIMEOUT
+        assert monitor.is_alive is False
+        assert [health.is_alive for health in health_updates] == [True, False]
+
+    def test_stop_monitoring_unblocks_wait(self, monitor):
+        """Test stop_monitoring wakes a monitor waiting without a deadline."""
+        monitor.start_monitoring()
+        thread = monitor._monitor_thread
+
+        started = time.monotonic()
+        monitor.stop_monitoring()
+
+        assert not thread.is_alive()
+        assert time.monotonic() - started < ConnectionMonitor.THREAD_JOIN_TIMEOUT_SECONDS
@@ -8,9 +8,20 @@ from carac.serialio.ports import (
     get_port_info,
     is_arduino_port,
     get_arduino_ports,
+    invalidate_port_cache,
 )
 
 
+def _mock_port(device, description="Generic USB Device", vid=None):
+    port = Mock()
+    port.device = device
+    port.description = description
+    port.manufacturer = None
+    port.product = None
+    port.vid = vid
+    return port
+
+
 class TestGetAvailablePorts:
     """Test get_available_ports function."""
     
@@ -182,46 +193,98 @@ class TestIsArduinoPort:
 
 class TestGetArduinoPorts:
     """Test get_arduino_ports function."""
-    
-    @patch('carac.serialio.ports.get_available_ports')
-    @patch('carac.serialio.ports.is_arduino_port')
-    def test_get_arduino_ports_success(self, mock_is_arduino, mock_get_ports):
+
+    @patch('carac.serialio.ports.serial.tools.list_ports.comports')
+    def test_get_arduino_ports_success(self, mock_comports):
         """Test successful Arduino port detection."""
-        mock_get_ports.return_value = ["COM1", "COM3", "COM5"]
-        
-        # Mock Arduino detection
-        def mock_is_arduino_side_effect(port):
-            return port == "COM3"
-        
-        mock_is_arduino.side_effect = mock_is_arduino_side_effect
-        
+        mock_comports.return_value = [
+            _mock_port("COM1"),
+            _mock_port("COM3", "Arduino Uno"),
+            _mock_port("COM5"),
+        ]
+
         arduino_ports = get_arduino_ports()
-        
+
         assert arduino_ports == ["COM3"]
-        assert mock_get_ports.call_count == 1
-        assert mock_is_arduino.call_count == 3
-    
-    @patch('carac.serialio.ports.get_available_ports')
-    def test_get_arduino_ports_no_ports(self, mock_get_ports):
+        mock_comports.assert_called_once()
+
+    @patch('carac.serialio.ports.serial.tools.list_ports.comports')
+    def test_get_arduino_ports_no_ports(self, mock_comports):
         """Test Arduino port detection with no ports."""
-        mock_get_ports.return_value = []
-        
+        mock_comports.return_value = []
+
         arduino_ports = get_arduino_ports()
-        
+
         assert arduino_ports == []
-    
-    @patch('carac.serialio.ports.get_available_ports')
-    @patch('carac.serialio.ports.is_arduino_port')
-    def test_get_arduino_ports_multiple_arduinos(self, mock_is_arduino, mock_get_ports):
+
+    @patch('carac.serialio.ports.serial.tools.list_ports.comports')
+    def test_get_arduino_ports_multiple_arduinos(self, mock_comports):
         """Test detection of multiple Arduino ports."""
-        mock_get_ports.return_value = ["COM1", "COM3", "COM5", "COM7"]
-        
-        # Mock Arduino detection
-        def mock_is_arduino_side_effect(port):
-            return port in ["COM3", "COM7"]
-        
-        mock_is_arduino.side_effect = mock_is_arduino_side_effect
-        
+        mock_comports.return_value = [
+            _mock_port("COM1"),
+            _mock_port("COM3", "USB Serial (CH340)"),
+            _mock_port("COM5"),
+            _mock_port("COM7", vid=0x2341),
+        ]
+
         arduino_ports = get_arduino_ports()
-        
+
         assert arduino_ports == ["COM3", "COM7"]
+
+
+class TestPortCache:
+    """Test the comports snapshot cache."""
+
+    def setup_method(self):
+        invalidate_port_cache()
+
+    def teardown_method(self):
+        invalidate_port_cache()
+
+    @patch('carac.serialio.ports.serial.tools.list_ports.comports')
+    def test_uncached_by_default(self, mock_comports):
+        """Test every call enumerates ports when max_age is zero."""
+        mock_comports.return_value = [_mock_port("COM1")]
+
+        get_available_ports()
+        get_available_ports()
+
+        assert mock_comports.call_count == 2
+
+    @patch('carac.serialio.ports.serial.tools.list_ports.comports')
+    def test_cached_within_max_age(self, mock_comports):
+        """Test calls within max_age reuse one enumeration."""
+        mock_comports.return_value = [_mock_port("COM3", "Arduino Uno")]
+
+        assert get_available_ports(60.0) == ["COM3"]
+        assert get_arduino_ports(60.0) == ["COM3"]
+        assert get_port_info("COM3", 60.0)["device"] == "COM3"
+
+        mock_comports.assert_called_once()
+
+    @patch('carac.serialio.ports.time.monotonic')
+    @patch('carac.serialio.ports.serial.tools.list_ports.comports')
+    def test_cache_expires(self, mock_comports, mock_monotonic):
+        """Test the snapshot is refreshed once it is older than max_age."""
+        mock_comports.return_value = [_mock_port("COM1")]
+        mock_monotonic.side_effect = [100.0, 100.5, 102.0]
+
+        get_available_ports(1.0)
+        get_available_ports(1.0)
+        get_available_ports(1.0)
+
+        assert mock_comports.call_count == 2
+
+    @patch('carac.serialio.ports.serial.tools.list_ports.comports')
+    def test_invalidate_port_cache(self, mock_comports):
+        """Test invalidation forces a fresh enumeration."""
+        mock_comports.return_value = [_mock_port("COM1")]
+        get_available_ports(60.0)
+
+        mock_comports.return_value = [_mock_port("COM1"), _mock_port("COM4")]
+        assert get_available_ports(60.0) == ["COM1"]
+
+        invalidate_port_cache()
+
+        assert get_available_ports(60.0) == ["COM1", "COM4"]
+        assert mock_comports.call_count == 2
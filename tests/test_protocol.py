@@ -1,35 +1,40 @@
 """Tests for protocol models."""
 
-import pytest
 import json
-from datetime import datetime
+
+import pytest
 
 from carac.protocol.models import (
-    Command,
-    Response,
-    LightingCommand,
-    PhotoSequenceCommand,
-    PingCommand,
-    StatusCommand,
-    CommandType,
+    AcknowledgmentPayload,
     ConnectionStatus,
+    ErrorCode,
+    HeartbeatPayload,
+    LightingSetCommand,
+    Message,
+    MessageType,
+    MotorFlipCommand,
+    Response,
+    SystemEmergencyStopCommand,
+    SystemPingCommand,
+    SystemResetCommand,
+    SystemStatusCommand,
+    TestLedToggleCommand,
+    decode_frame,
 )
 
-
-class TestCommandType:
-    """Test CommandType enum."""
-    
-    def test_command_types(self):
-        """Test all command types are defined."""
-        assert CommandType.LIGHTING == "lighting"
-        assert CommandType.PHOTO_SEQUENCE == "photo_sequence"
-        assert CommandType.PING == "ping"
-        assert CommandType.STATUS == "status"
+STATIC_COMMANDS = [
+    MotorFlipCommand,
+    SystemPingCommand,
+    SystemStatusCommand,
+    SystemResetCommand,
+    SystemEmergencyStopCommand,
+    TestLedToggleCommand,
+]
 
 
 class TestConnectionStatus:
     """Test ConnectionStatus enum."""
-    
+
     def test_connection_statuses(self):
         """Test all connection statuses are defined."""
         assert ConnectionStatus.DISCONNECTED == "disconnected"
@@ -38,152 +43,181 @@ class TestConnectionStatus:
         assert ConnectionStatus.ERROR == "error"
 
 
-class TestCommand:
-    """Test base Command model."""
-    
-    def test_command_creation(self):
-        """Test command creation."""
-        command = Command(type=CommandType.PING, data={"test": "value"})
-        
-        assert command.type == CommandType.PING
-        assert command.data == {"test": "value"}
-        assert command.timestamp is None
-    
-    def test_command_to_serial(self):
-        """Test command serialization."""
-        command = Command(type=CommandType.PING, data={"test": "value"})
-        serial_data = command.to_serial()
-        
-        # Should be valid JSON with newline
-        assert serial_data.endswith('\n')
-        
-        # Parse and verify
-        parsed = json.loads(serial_data.strip())
-        assert parsed["type"] == "ping"
-        assert parsed["data"] == {"test": "value"}
+class TestMessage:
+    """Test Message serialization and parsing."""
+
+    def test_to_bytes_without_seq(self):
+        """Test a frame without sequence number."""
+        message = LightingSetCommand.create("ring_1", 128)
+
+        frame = message.to_bytes()
+
+        assert frame.endswith(b"\n")
+        assert json.loads(frame) == {
+            "type": MessageType.LIGHTING_SET,
+            "payload": {"channel": "ring_1", "intensity": 128},
+        }
+
+    def test_to_bytes_with_seq(self):
+        """Test the sequence number is added to the frame."""
+        message = LightingSetCommand.create("ring_1", 128)
+
+        assert json.loads(message.to_bytes(7))["seq"] == 7
+
+    def test_from_serial_valid(self):
+        """Test parsing a valid message."""
+        message = Message.from_serial(
+            '{"type": "response_success", "payload": {"message": "ok"}, "seq": 3}\n'
+        )
+
+        assert message.type == MessageType.RESPONSE_SUCCESS
+        assert message.payload == {"message": "ok"}
+        assert message.seq == 3
+
+    def test_from_serial_invalid(self):
+        """Test parsing invalid JSON returns an error message."""
+        message = Message.from_serial("invalid json")
+
+        assert message.type == MessageType.RESPONSE_ERROR
+        assert message.payload["error_code"] == ErrorCode.PARSE_ERROR
+        assert message.payload["data"]["raw"] == "invalid json"
+
+    def test_from_serial_invalid_utf8(self):
+        """Test non-UTF-8 bytes are decoded leniently instead of raising."""
+        message = Message.from_serial(
+            b'{"type": "event_status", "payload": {"message": "caf\xe9"}}'
+        )
+
+        assert message.type == "event_status"
+        assert message.payload == {"message": "caf\ufffd"}
+
+    def test_from_serial_invalid_utf8_garbage(self):
+        """Test undecodable garbage returns an error message."""
+        message = Message.from_serial(b"\xff{}")
+
+        assert message.type == MessageType.RESPONSE_ERROR
+        assert message.payload["data"]["raw"] == "\ufffd{}"
+
+    def test_from_serial_empty(self):
+        """Test parsing an empty message returns an error message."""
+        message = Message.from_serial("")
+
+        assert message.type == MessageType.RESPONSE_ERROR
+        assert message.payload["message"] == "Empty message received"
+
+
+class TestStaticCommand:
+    """Test cached frames of payload-less commands."""
+
+    @pytest.mark.parametrize("command_class", STATIC_COMMANDS)
+    def test_to_bytes_matches_message(self, command_class):
+        """Test cached frames match the generic Message encoding."""
+        command = command_class.shared()
+        reference = Message(type=command.type, payload={})
+
+        assert command.to_bytes() == reference.to_bytes()
+        assert command.to_bytes(42) == reference.to_bytes(42)
+        assert command.to_bytes(43) == reference.to_bytes(43)
+
+    def test_shared_instance(self):
+        """Test shared() returns one frozen instance per command class."""
+        command = SystemPingCommand.shared()
+
+        assert SystemPingCommand.shared() is command
+        assert SystemStatusCommand.shared() is not command
+        with pytest.raises(ValueError):
+            command.type = MessageType.SYSTEM_STATUS
 
 
 class TestResponse:
     """Test Response model."""
-    
-    def test_response_creation(self):
-        """Test response creation."""
-        response = Response(
-            success=True,
-            message="Test message",
-            data={"result": "ok"}
+
+    def test_response_from_success_message(self):
+        """Test response built from a success message."""
+        response = Response.from_message(
+            Message(
+                type=MessageType.RESPONSE_SUCCESS,
+                payload={"message": "pong", "data": {"uptime": 5}},
+            )
         )
-        
-        assert response.success is True
-        assert response.message == "Test message"
-        assert response.data == {"result": "ok"}
-        assert response.timestamp is None
-    
-    def test_response_from_serial_valid(self):
-        """Test response deserialization with valid JSON."""
-        json_data = '{"success": true, "message": "OK", "data": {"test": "value"}}'
-        response = Response.from_serial(json_data)
-        
+
         assert response.success is True
-        assert response.message == "OK"
-        assert response.data == {"test": "value"}
-    
+        assert response.message == "pong"
+        assert response.data == {"uptime": 5}
+
+    def test_response_from_error_message(self):
+        """Test response built from an error message."""
+        response = Response.from_message(
+            Message(type=MessageType.RESPONSE_ERROR, payload={"message": "busy"})
+        )
+
+        assert response.success is False
+        assert response.message == "busy"
+
     def test_response_from_serial_invalid(self):
-        """Test response deserialization with invalid JSON."""
-        invalid_data = "invalid json"
-        response = Response.from_serial(invalid_data)
-        
+        """Test invalid serial data produces a failed response."""
+        response = Response.from_serial("invalid json")
+
         assert response.success is False
-        assert "Failed to parse response" in response.message
-        assert response.data["raw"] == invalid_data
-    
-    def test_response_from_serial_empty(self):
-        """Test response deserialization with empty data."""
-        response = Response.from_serial("")
-        
+
+    def test_response_from_serial_invalid_utf8(self):
+        """Test non-UTF-8 serial data produces a failed response."""
+        response = Response.from_serial(b"\xff{}")
+
         assert response.success is False
-        assert "Failed to parse response" in response.message
-
-
-class TestLightingCommand:
-    """Test LightingCommand model."""
-    
-    def test_lighting_command_creation(self):
-        """Test lighting command creation."""
-        command = LightingCommand(channel="axial", intensity=128)
-        
-        assert command.type == CommandType.LIGHTING
-        assert command.channel == "axial"
-        assert command.intensity == 128
-        assert command.data == {"channel": "axial", "intensity": 128}
-    
-    def test_lighting_command_validation(self):
-        """Test lighting command validation."""
-        # Valid intensity
-        command = LightingCommand(channel="ring", intensity=255)
-        assert command.intensity == 255
-        
-        # Should clamp to max
-        command = LightingCommand(channel="backlight", intensity=300)
-        assert command.intensity == 255
-        
-        # Should clamp to min
-        command = LightingCommand(channel="axial", intensity=-10)
-        assert command.intensity == 0
-
-
-class TestPhotoSequenceCommand:
-    """Test PhotoSequenceCommand model."""
-    
-    def test_photo_sequence_command_creation(self):
-        """Test photo sequence command creation."""
-        command = PhotoSequenceCommand(count=10, delay=2.5)
-        
-        assert command.type == CommandType.PHOTO_SEQUENCE
-        assert command.count == 10
-        assert command.delay == 2.5
-        assert command.data == {"count": 10, "delay": 2.5}
-    
-    def test_photo_sequence_command_defaults(self):
-        """Test photo sequence command defaults."""
-        command = PhotoSequenceCommand()
-        
-        assert command.count == 5
-        assert command.delay == 1.0
-    
-    def test_photo_sequence_command_validation(self):
-        """Test photo sequence command validation."""
-        # Valid values
-        command = PhotoSequenceCommand(count=50, delay=5.0)
-        assert command.count == 50
-        assert command.delay == 5.0
-        
-        # Should clamp count
-        command = PhotoSequenceCommand(count=200)
-        assert command.count == 100
-        
-        # Should clamp delay
-        command = PhotoSequenceCommand(delay=15.0)
-        assert command.delay == 10.0
-
-
-class TestPingCommand:
-    """Test PingCommand model."""
-    
-    def test_ping_command_creation(self):
-        """Test ping command creation."""
-        command = PingCommand()
-        
-        assert command.type == CommandType.PING
-        assert command.data == {"ping": True}
-
-
-class TestStatusCommand:
-    """Test StatusCommand model."""
-    
-    def test_status_command_creation(self):
-        """Test status command creation."""
-        command = StatusCommand()
-        
-        assert command.type == CommandType.STATUS
-        assert command.data == {"status": True}
+
+
+class TestDecodeFrame:
+    """Test decode_frame fast paths."""
+
+    def test_heartbeat(self):
+        """Test heartbeats decode to HeartbeatPayload."""
+        decoded = decode_frame(
+            b'{"type": "event_heartbeat", "payload": {"uptime": 1200, "status": "ok"}}'
+        )
+
+        assert decoded == HeartbeatPayload(uptime=1200, status="ok")
+
+    def test_acknowledgment(self):
+        """Test acks decode to AcknowledgmentPayload."""
+        decoded = decode_frame(
+            b'{"type": "response_ack", "payload": '
+            b'{"received_type": "system_ping", "timestamp": 99}}'
+        )
+
+        assert decoded == AcknowledgmentPayload(
+            received_type="system_ping", timestamp=99
+        )
+
+    def test_other_message(self):
+        """Test other frames decode to Message."""
+        decoded = decode_frame(
+            b'{"type": "response_success", "payload": {"message": "ok"}, "seq": 4}'
+        )
+
+        assert isinstance(decoded, Message)
+        assert decoded.seq == 4
+
+    def test_invalid_json(self):
+        """Test malformed frames decode to a parse error message."""
+        decoded = decode_frame(b"{not json")
+
+        assert isinstance(decoded, Message)
+        assert decoded.type == MessageType.RESPONSE_ERROR
+
+    def test_invalid_utf8(self):
+        """Test non-UTF-8 frames are decoded leniently instead of raising."""
+        decoded = decode_frame(
+            b'{"type": "event_status", "payload": {"message": "caf\xe9"}}'
+        )
+
+        assert isinstance(decoded, Message)
+        assert decoded.type == "event_status"
+        assert decoded.payload == {"message": "caf\ufffd"}
+
+    def test_invalid_utf8_garbage(self):
+        """Test undecodable frames decode to a parse error message."""
+        decoded = decode_frame(b"\xff{}")
+
+        assert isinstance(decoded, Message)
+        assert decoded.type == MessageType.RESPONSE_ERROR